@@ -0,0 +1,174 @@
+"""
+Asset Pipeline for Hangman Game
+
+This module decodes images and sounds on a thread pool and keeps an on-disk
+cache of scaled images as raw pixels, so later launches skip JPEG decoding
+and resampling.
+"""
+
+import hashlib
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pygame
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "images")
+
+# Byte order of the usual 32-bit display format on little-endian machines,
+# so converting a cached image to the display format is a straight copy
+PIXEL_FORMAT = "BGRA"
+
+# Cache file header: magic, width, height
+CACHE_HEADER = struct.Struct("<4sII")
+CACHE_MAGIC = b"HMPX"
+CACHE_VERSION = b"1"
+
+class ImageCache:
+    """On-disk cache of scaled image pixels, keyed by a hash of the source file and target size"""
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, data, size):
+        digest = hashlib.sha256(data)
+        digest.update(CACHE_VERSION + PIXEL_FORMAT.encode() + struct.pack("<II", *size))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key + ".pix")
+
+    def read(self, key):
+        """Returns (size, pixels) for a cached image, or None"""
+        try:
+            with open(self.path(key), "rb") as f:
+                magic, width, height = CACHE_HEADER.unpack(f.read(CACHE_HEADER.size))
+                pixels = f.read()
+        except (OSError, struct.error):
+            return None
+        if magic != CACHE_MAGIC or len(pixels) != width * height * len(PIXEL_FORMAT):
+            return None
+        return (width, height), pixels
+
+    def write(self, key, surface):
+        """Store a surface's pixels; failures only cost a cache miss next time"""
+        width, height = surface.get_size()
+        pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self.path(key) + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(CACHE_HEADER.pack(CACHE_MAGIC, width, height))
+                f.write(pixels)
+            os.replace(tmp_path, self.path(key))
+        except OSError:
+            pass
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class AssetLoader:
+    """Loads images and sounds on worker threads; results are collected on the main thread"""
+    def __init__(self, image_cache=None, max_workers=4):
+        self.image_cache = image_cache if image_cache is not None else ImageCache()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assets")
+        self.pending = {}
+        self.loaded = {}
+        self.load_ms = {}
+        self.started_at = None
+
+    def load_image(self, name, path, size):
+        """Start loading an image scaled to size"""
+        if name not in self.pending and name not in self.loaded:
+            self.pending[name] = ("image", self.submit(name, self.read_image, path, size))
+
+    def load_sound(self, name, path):
+        """Start decoding a sound; the mixer must already be initialized"""
+        if name not in self.pending and name not in self.loaded:
+            self.pending[name] = ("sound", self.submit(name, self.read_sound, path))
+
+    def submit(self, name, function, *args):
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+        return self.executor.submit(self.timed, name, function, *args)
+
+    def timed(self, name, function, *args):
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.load_ms[name] = (time.perf_counter() - start) * 1000
+
+    def read_image(self, path, size):
+        """Worker thread: returns cached pixels or a freshly decoded, scaled surface"""
+        with open(path, "rb") as f:
+            data = f.read()
+        key = self.image_cache.key(data, size)
+        cached = self.image_cache.read(key)
+        if cached is not None:
+            self.image_cache.hits += 1
+            return key, cached
+        self.image_cache.misses += 1
+        image = pygame.image.load(path)
+        return key, pygame.transform.scale(image, size)
+
+    def read_sound(self, path):
+        return pygame.mixer.Sound(path)
+
+    def done(self):
+        return all(future.done() for _, future in self.pending.values())
+
+    def wait(self, timeout):
+        """Block until every pending asset is loaded or the timeout passes; returns done()"""
+        wait([future for _, future in self.pending.values()], timeout=timeout)
+        return self.done()
+
+    def get(self, name):
+        """Wait for an asset and return it, or None if it failed to load"""
+        if name in self.loaded:
+            return self.loaded[name]
+        kind, future = self.pending.pop(name)
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Error loading {name}: {e}")
+            result = None
+        if kind == "image" and result is not None:
+            result = self.finish_image(*result)
+        self.loaded[name] = result
+        return result
+
+    def finish_image(self, key, result):
+        """Main thread: convert to the display format, caching newly scaled images"""
+        if isinstance(result, pygame.Surface):
+            surface = result.convert()
+            self.executor.submit(self.image_cache.write, key, surface.copy())
+            return surface
+        size, pixels = result
+        return pygame.image.frombuffer(pixels, size, PIXEL_FORMAT).convert()
+
+    def image(self, name, path, size):
+        """Load an image, starting the load if it was not preloaded"""
+        self.load_image(name, path, size)
+        return self.get(name)
+
+    def sound(self, name, path):
+        """Load a sound, starting the load if it was not preloaded"""
+        self.load_sound(name, path)
+        return self.get(name)
+
+    def report(self):
+        """Returns load times and image cache statistics"""
+        return {
+            "assets_ms": dict(self.load_ms),
+            "wall_ms": (time.perf_counter() - self.started_at) * 1000 if self.started_at else 0.0,
+            "cache_hits": self.image_cache.hits,
+            "cache_misses": self.image_cache.misses,
+            "cache_hit_rate": self.image_cache.hit_rate(),
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,127 @@
+"""
+Audio Engine for Hangman Game
+
+Starts the mixer with a small buffer so effects play soon after a click,
+gives every effect its own reserved channels so rapid guesses never wait
+for a free one, and synthesizes short tones with NumPy for effects whose
+sound files are missing. Click-to-sound latency is measured from the moment
+the click is taken off the event queue to the moment the effect is queued,
+plus the mixer buffer; time the click spent in SDL's queue before that is
+not visible to the game.
+"""
+
+import time
+
+import pygame
+from pygame import mixer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # No synthesized tones; missing sound files stay silent
+
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 256  # Samples per mixer buffer; 256 at 44.1 kHz is about 6 ms
+CHANNELS_PER_EFFECT = 2  # A repeat can start while the previous one is still playing
+VOLUME = 0.35
+
+# Notes of each synthesized effect as (frequency in Hz, seconds)
+TONES = {
+    "correct": [(880, 0.05), (1320, 0.08)],
+    "wrong": [(196, 0.16)],
+    "win": [(523, 0.09), (659, 0.09), (784, 0.09), (1047, 0.25)],
+    "lose": [(392, 0.16), (330, 0.16), (262, 0.35)],
+}
+
+def synthesize(notes, frequency):
+    """Returns mono float samples in [-1, 1] for a sequence of notes"""
+    parts = []
+    for pitch, seconds in notes:
+        t = np.arange(int(seconds * frequency)) / frequency
+        wave = np.sin(2 * np.pi * pitch * t) + 0.3 * np.sin(4 * np.pi * pitch * t)
+        # Short attack and an exponential decay keep the note edges click-free
+        envelope = np.minimum(t / 0.005, 1.0) * np.exp(-4.0 * t / seconds)
+        parts.append(wave * envelope / 1.3)
+    return np.concatenate(parts) * VOLUME
+
+class AudioEngine:
+    """Mixer setup, reserved channels per effect and latency statistics"""
+    def __init__(self, frequency=MIXER_FREQUENCY, buffer=MIXER_BUFFER, channels_per_effect=CHANNELS_PER_EFFECT):
+        self.frequency = frequency
+        self.buffer = buffer
+        self.channels_per_effect = channels_per_effect
+        self.available = None  # Unknown until start()
+        self.reserved = 0
+        self.channels = {}  # Effect name -> [Channel]
+        self.next_channel = {}
+        self.tones = {}
+        self.input_time = None
+        self.latencies_ms = []
+
+    def start(self):
+        """Open the audio device once; returns False if there is none"""
+        if self.available is None:
+            try:
+                if not mixer.get_init():
+                    mixer.init(frequency=self.frequency, size=-16, channels=2, buffer=self.buffer)
+                self.available = True
+            except pygame.error:
+                self.available = False
+        return self.available
+
+    def channels_for(self, name):
+        """Reserve this effect's channels the first time it plays"""
+        channels = self.channels.get(name)
+        if channels is None:
+            first = self.reserved
+            self.reserved += self.channels_per_effect
+            if mixer.get_num_channels() < self.reserved + 8:
+                mixer.set_num_channels(self.reserved + 8)
+            # Reserved channels are never handed out by Sound.play() for other sounds
+            mixer.set_reserved(self.reserved)
+            channels = [mixer.Channel(i) for i in range(first, self.reserved)]
+            self.channels[name] = channels
+            self.next_channel[name] = 0
+        return channels
+
+    def tone(self, name):
+        """Returns a synthesized Sound for an effect in TONES, or None without NumPy"""
+        if np is None or not self.start():
+            return None
+        if name not in self.tones:
+            frequency, size, channels = mixer.get_init()
+            samples = synthesize(TONES[name], frequency)
+            if size == -16:
+                samples = (samples * 32767).astype(np.int16)
+            elif size == 32:
+                samples = samples.astype(np.float32)
+            else:
+                return None
+            # Same samples on every output channel
+            samples = np.repeat(samples[:, None], channels, axis=1)
+            self.tones[name] = mixer.Sound(buffer=samples.tobytes())
+        return self.tones[name]
+
+    def mark_input(self, timestamp=None):
+        """Note when an input event that may trigger a sound was received (default: now)"""
+        self.input_time = timestamp if timestamp is not None else time.perf_counter()
+
+    def play(self, name, sound):
+        """Play a sound on the effect's next reserved channel"""
+        channels = self.channels_for(name)
+        index = self.next_channel[name]
+        self.next_channel[name] = (index + 1) % len(channels)
+        channels[index].play(sound)
+        if self.input_time is not None:
+            self.latencies_ms.append((time.perf_counter() - self.input_time) * 1000)
+            self.input_time = None
+
+    def latency_report(self):
+        """Returns p50/p99 input-to-play times and the mixer buffer duration, in milliseconds"""
+        frequency = mixer.get_init()[0] if mixer.get_init() else self.frequency
+        report = {"sounds": len(self.latencies_ms), "buffer_ms": self.buffer / frequency * 1000}
+        if self.latencies_ms:
+            ordered = sorted(self.latencies_ms)
+            report["dispatch_p50_ms"] = ordered[len(ordered) // 2]
+            report["dispatch_p99_ms"] = ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)]
+        return report
@@ -0,0 +1,279 @@
+"""
+Benchmark Suite for Hangman Game
+
+Times rendering, input dispatch, game-logic throughput and startup under
+SDL's dummy video and audio drivers, writes the results as JSON and compares
+them against a stored baseline.
+
+Usage:
+    python benchmark.py --output results.json
+    python benchmark.py --save-baseline
+    python benchmark.py --baseline benchmark_baseline.json --threshold 0.25 --threshold draw_game=0.5
+"""
+
+import os
+
+# Must be set before pygame creates a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+
+import pygame
+
+import hangman
+from engine import HangmanEngine
+from scheduler import WordScheduler
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.25  # Allowed slowdown relative to the baseline
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+def time_calls(function, repeat, warmup=10):
+    """Returns per-call times in milliseconds"""
+    for _ in range(warmup):
+        function()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def frame_result(samples):
+    return {
+        "value": percentile(samples, 0.5),
+        "unit": "ms",
+        "better": "lower",
+        "p95": percentile(samples, 0.95),
+        "mean": sum(samples) / len(samples),
+    }
+
+def rate_result(operations, seconds):
+    return {"value": operations / seconds, "unit": "ops/s", "better": "higher"}
+
+def new_game(game, category, guesses):
+    """Put the game on the playing screen with a fixed word and guesses"""
+    game.reset_game()
+    game.game_state = "playing"
+    game.engine.start_word(category, game.corpus[category][0])
+    for letter in guesses:
+        game.engine.check_guess(letter)
+
+def bench_draw(game, repeat):
+    """Full-frame cost of each draw_* method"""
+    category = game.corpus.category_at(0)
+    results = {}
+    game.game_state = "menu"
+    results["draw_menu"] = frame_result(time_calls(game.draw_menu, repeat))
+    game.game_state = "category_select"
+    results["draw_category_select"] = frame_result(time_calls(game.draw_category_select, repeat))
+    new_game(game, category, "AEQZ")
+    results["draw_game"] = frame_result(time_calls(game.draw_game, repeat))
+    game.game_state = "game_over"
+    results["draw_game_over"] = frame_result(time_calls(game.draw_game_over, repeat))
+    return results
+
+def bench_present(game, repeat):
+    """Per-frame cost of presenting an unchanged frame and a single hover change"""
+    category = game.corpus.category_at(0)
+    new_game(game, category, "")
+    game.present()
+    results = {"present_idle": frame_result(time_calls(game.present, repeat))}
+
+    # Alternate the pointer between a letter and empty space, as handle_event would
+    button = game.letter_buttons[0]
+    def hover_frame():
+        game.hover_pos = (0, 0) if game.hovered is button else button.rect.center
+        game.update_hover()
+        game.present()
+    results["present_hover"] = frame_result(time_calls(hover_frame, repeat))
+    return results
+
+def bench_events(game, repeat, burst=100):
+    """Dispatch cost of a burst of mouse motion events followed by a click"""
+    category = game.corpus.category_at(0)
+    rng = random.Random(0)
+    positions = [(rng.randrange(hangman.SCREEN_WIDTH), rng.randrange(hangman.SCREEN_HEIGHT)) for _ in range(burst)]
+    motion = [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)) for pos in positions]
+    click_pos = game.letter_buttons[-1].rect.center
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=click_pos, button=1)
+
+    def dispatch_burst():
+        new_game(game, category, "")
+        for event in motion:
+            game.handle_event(event)
+        game.update_hover()
+        game.handle_event(click)
+    return {"event_burst": frame_result(time_calls(dispatch_burst, repeat))}
+
+def bench_engine(corpus, operations):
+    """Throughput of the game rules"""
+    engine = HangmanEngine(corpus, rng=random.Random(0))
+    categories = corpus.names
+    results = {}
+
+    start = time.perf_counter()
+    for i in range(operations):
+        engine.select_word(categories[i % len(categories)])
+    results["select_word"] = rate_result(operations, time.perf_counter() - start)
+
+    adaptive = HangmanEngine(corpus, rng=random.Random(0), scheduler=WordScheduler(corpus))
+    start = time.perf_counter()
+    for i in range(operations):
+        adaptive.select_word(categories[i % len(categories)])
+    results["select_word_adaptive"] = rate_result(operations, time.perf_counter() - start)
+
+    letters = "ETAOINSRHLDCUMFPGWYBVKXJQZ0123456789"
+    start = time.perf_counter()
+    guesses = 0
+    while guesses < operations:
+        engine.start_word(categories[0], "CLOUDFORMATION")
+        for letter in letters:
+            engine.check_guess(letter)
+            guesses += 1
+            if engine.status != "playing":
+                break
+    results["check_guess"] = rate_result(guesses, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(operations):
+        engine.is_word_guessed()
+    results["is_word_guessed"] = rate_result(operations, time.perf_counter() - start)
+    return results
+
+def bench_hint(game, repeat):
+    """Cost of a Hint click on the UI thread, and the wait for the worker's answer"""
+    category = game.corpus.category_at(0)
+    new_game(game, category, "E")
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=game.hint_button.rect.center, button=1)
+    # The first answer may wait for a table build
+    game.hints.hint(game.engine).result()
+    clicks = []
+    answers = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        game.handle_event(click)
+        clicked = time.perf_counter()
+        game.hint_future.result()
+        answers.append((time.perf_counter() - clicked) * 1000)
+        clicks.append((clicked - start) * 1000)
+    pygame.event.clear(hangman.HINT_READY)
+    return {"hint_click": frame_result(clicks), "hint_answer": frame_result(answers)}
+
+def bench_startup(runs):
+    """Cold-process startup, up to the first presented frame"""
+    script = "import json, hangman; print(json.dumps(hangman.measure_startup()))"
+    totals = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout
+        totals.append(json.loads(output.strip().splitlines()[-1])["since_import"])
+    return {"startup": frame_result(totals)}
+
+def run_suite(repeat, operations, startup_runs):
+    hangman.init_app()
+    game = hangman.Hangman()
+    results = {}
+    results.update(bench_draw(game, repeat))
+    results.update(bench_present(game, repeat))
+    results.update(bench_events(game, repeat))
+    results.update(bench_hint(game, repeat))
+    results.update(bench_engine(game.corpus, operations))
+    if startup_runs:
+        results.update(bench_startup(startup_runs))
+    game.hints.close()
+    pygame.quit()
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def compare(current, baseline, default_threshold, thresholds):
+    """Returns a list of (name, baseline, current, change, regressed) rows"""
+    rows = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        old = baseline["results"][name]["value"]
+        new = result["value"]
+        change = (new - old) / old if old else 0.0
+        if result["better"] == "higher":
+            change = -change
+        threshold = thresholds.get(name, default_threshold)
+        rows.append((name, old, new, change, change > threshold))
+    return rows
+
+def parse_thresholds(values):
+    """Returns (default, {name: threshold}) from values like '0.3' or 'draw_game=0.5'"""
+    default = DEFAULT_THRESHOLD
+    per_benchmark = {}
+    for value in values:
+        if "=" in value:
+            name, _, limit = value.partition("=")
+            per_benchmark[name] = float(limit)
+        else:
+            default = float(value)
+    return default, per_benchmark
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rendering, input dispatch, game logic and startup")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--threshold", action="append", default=[],
+                        help="Allowed slowdown as a fraction, globally or as NAME=FRACTION")
+    parser.add_argument("--repeat", type=int, default=200, help="Frames per rendering benchmark")
+    parser.add_argument("--operations", type=int, default=200000, help="Calls per game-logic benchmark")
+    parser.add_argument("--startup-runs", type=int, default=3)
+    args = parser.parse_args()
+
+    current = run_suite(args.repeat, args.operations, args.startup_runs)
+    for name, result in current["results"].items():
+        print(f"{name:>22}: {result['value']:14,.3f} {result['unit']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against; run with --save-baseline first.")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    default_threshold, thresholds = parse_thresholds(args.threshold)
+    regressions = 0
+    print(f"\nCompared with {args.baseline} (positive change = slower):")
+    for name, old, new, change, regressed in compare(current, baseline, default_threshold, thresholds):
+        regressions += regressed
+        flag = "REGRESSION" if regressed else "ok"
+        print(f"{name:>22}: {old:14,.3f} -> {new:14,.3f} ({change:+.1%}) {flag}")
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
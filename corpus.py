@@ -0,0 +1,242 @@
+"""
+Word Corpus Module for Hangman Game
+
+This module indexes the word lists by category, word length, distinct-letter
+count and letter-set mask. Categories come from custom_words.py and from
+one-word-per-line text files in the 'words' folder; large files are
+memory-mapped instead of being parsed into Python lists, through a private
+copy so that editing a file while the game runs cannot invalidate the map. Words with symbols
+outside ASCII are skipped and reported, and categories without any words
+are left out.
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from collections.abc import Mapping, Sequence
+
+from engine import letter_mask, load_word_categories
+
+WORDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words")
+
+# Word list files larger than this are memory-mapped
+MMAP_THRESHOLD = 64 * 1024
+
+# Sidecar index written next to each mapped file: magic, version, file size, mtime, word count
+INDEX_SUFFIX = ".idx"
+INDEX_HEADER = struct.Struct("<4sIQQI")
+INDEX_MAGIC = b"HMIX"
+INDEX_VERSION = 1
+
+class WordList(Sequence):
+    """Words of one category, with a letter mask per word and lazily built group indexes"""
+    masks = None
+    skipped = 0  # Words left out for having non-ASCII symbols
+    _groups = None
+
+    def mask_at(self, index):
+        return self.masks[index]
+
+    def length_at(self, index):
+        return len(self[index])
+
+    def groups(self):
+        """Returns word indexes grouped by length, distinct-letter count and letter mask"""
+        if self._groups is None:
+            by_length = {}
+            by_distinct = {}
+            by_mask = {}
+            for index, mask in enumerate(self.masks):
+                by_length.setdefault(self.length_at(index), array("I")).append(index)
+                by_distinct.setdefault(bin(mask).count("1"), array("I")).append(index)
+                by_mask.setdefault(mask, array("I")).append(index)
+            self._groups = {"length": by_length, "distinct": by_distinct, "mask": by_mask}
+        return self._groups
+
+    def with_length(self, length):
+        return self.groups()["length"].get(length, array("I"))
+
+    def with_distinct_letters(self, count):
+        return self.groups()["distinct"].get(count, array("I"))
+
+    def with_mask(self, mask):
+        return self.groups()["mask"].get(mask, array("I"))
+
+class MemoryWordList(WordList):
+    """Word list held in memory, for custom_words.py and small files"""
+    def __init__(self, words):
+        words = [word.strip().upper() for word in words if word.strip()]
+        self.words = [word for word in words if word.isascii()]
+        self.skipped = len(words) - len(self.words)
+        self.masks = array("Q", (letter_mask(word) for word in self.words))
+
+    def __len__(self):
+        return len(self.words)
+
+    def __getitem__(self, index):
+        return self.words[index]
+
+class MappedWordList(WordList):
+    """Word list read from a memory-mapped copy of a one-word-per-line file
+
+    Mapping the file itself would let a hot-reload edit that shortens it in
+    place turn reads of the old mapping into SIGBUS, so the file is copied
+    to an unlinked temporary file, which nothing else can write, and that
+    copy is mapped.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f, tempfile.TemporaryFile() as copy:
+            self.signature = stat_signature(os.fstat(f.fileno()))
+            shutil.copyfileobj(f, copy)
+            copy.flush()
+            if stat_signature(os.fstat(f.fileno())) != self.signature:
+                self.signature = None  # Written to while copying; the index is rebuilt from the copy
+            self.data = mmap.mmap(copy.fileno(), 0, access=mmap.ACCESS_READ)
+        if not self.load_index():
+            self.build_index()
+            self.save_index()
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        return self.data[self.starts[index]:self.ends[index]].decode("ascii").upper()
+
+    def length_at(self, index):
+        return self.ends[index] - self.starts[index]
+
+    def build_index(self):
+        """Scan the file once for word offsets and letter masks"""
+        self.starts = array("I")
+        self.ends = array("I")
+        self.masks = array("Q")
+        data = self.data
+        size = len(data)
+        pos = 0
+        while pos < size:
+            end = data.find(b"\n", pos)
+            if end == -1:
+                end = size
+            word = data[pos:end].strip()
+            if word and not word.isascii():
+                self.skipped += 1
+            elif word:
+                start = data.find(word, pos, end)
+                self.starts.append(start)
+                self.ends.append(start + len(word))
+                self.masks.append(letter_mask(word.decode("ascii").upper()))
+            pos = end + 1
+
+    def index_path(self):
+        return self.path + INDEX_SUFFIX
+
+    def load_index(self):
+        """Load offsets and masks from the sidecar index if it matches the file"""
+        try:
+            with open(self.index_path(), "rb") as f:
+                magic, version, size, mtime, count = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+                if magic != INDEX_MAGIC or version != INDEX_VERSION or (size, mtime) != self.signature:
+                    return False
+                self.starts = array("I")
+                self.ends = array("I")
+                self.masks = array("Q")
+                self.starts.fromfile(f, count)
+                self.ends.fromfile(f, count)
+                self.masks.fromfile(f, count)
+        except (OSError, EOFError, struct.error):
+            return False
+        return True
+
+    def save_index(self):
+        if self.signature is None:
+            return
+        size, mtime = self.signature
+        try:
+            with open(self.index_path(), "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, size, mtime, len(self.starts)))
+                self.starts.tofile(f)
+                self.ends.tofile(f)
+                self.masks.tofile(f)
+        except OSError:
+            pass  # The index is only a startup cache
+
+class WordCorpus(Mapping):
+    """Ordered mapping of category name -> WordList"""
+    def __init__(self):
+        self.names = []
+        self.lists = {}
+
+    def add(self, name, words):
+        """Add or replace a category, keeping its position in the order"""
+        if name not in self.lists:
+            self.names.append(name)
+        self.lists[name] = words
+
+    def remove(self, name):
+        if name in self.lists:
+            self.names.remove(name)
+            del self.lists[name]
+
+    def __getitem__(self, name):
+        return self.lists[name]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def category_at(self, index):
+        return self.names[index]
+
+    def page(self, page, per_page):
+        """Returns the category names shown on one page"""
+        return self.names[page * per_page:(page + 1) * per_page]
+
+    def page_count(self, per_page):
+        return (len(self.names) + per_page - 1) // per_page
+
+    def word_count(self):
+        return sum(len(words) for words in self.lists.values())
+
+def stat_signature(stat):
+    return stat.st_size, stat.st_mtime_ns
+
+def category_name(filename):
+    """Returns the category name for a word list file, e.g. 'AWS_IoT.txt' -> 'AWS IoT'"""
+    return os.path.splitext(filename)[0].replace("_", " ")
+
+def load_word_file(path):
+    """Returns a WordList for a file, memory-mapping large ones"""
+    if os.path.getsize(path) > MMAP_THRESHOLD:
+        words = MappedWordList(path)
+    else:
+        # Undecodable bytes become non-ASCII characters, so those words are skipped
+        with open(path, encoding="utf-8", errors="replace") as f:
+            words = MemoryWordList(f)
+    report_skipped(path, words)
+    return words
+
+def report_skipped(source, words):
+    if words.skipped:
+        print(f"Skipped {words.skipped} words with non-ASCII symbols in {source}")
+
+def load_corpus(words_dir=WORDS_DIR):
+    """Build the corpus from custom_words.py plus any word list files, leaving out empty categories"""
+    corpus = WordCorpus()
+    for name, words in load_word_categories().items():
+        words = MemoryWordList(words)
+        report_skipped(name, words)
+        if len(words):
+            corpus.add(name, words)
+    if os.path.isdir(words_dir):
+        for filename in sorted(os.listdir(words_dir)):
+            if filename.endswith(".txt"):
+                words = load_word_file(os.path.join(words_dir, filename))
+                if len(words):
+                    corpus.add(category_name(filename), words)
+    return corpus
@@ -0,0 +1,76 @@
+"""
+Display Modes for Hangman Game
+
+The game lays everything out on a fixed 800x600 logical canvas. In the
+scaled modes SDL presents the canvas through its renderer (GPU-backed where
+available), letterboxed to any window or screen size, and maps mouse
+positions back onto the canvas. The canvas itself is rasterized at a
+multiple of the logical size picked for the target resolution, so text,
+the background and the gallows are drawn sharp once per resolution and
+cached, instead of being upscaled from 800x600.
+"""
+
+import math
+
+import pygame
+
+DISPLAY_MODES = ("window", "scaled", "fullscreen")
+SCALE_STEP = 0.25  # Render scales are rounded down to this, so few of them get cached
+WINDOW_FILL = 0.9  # Share of the desktop a scaled window starts at
+
+class Viewport:
+    """Maps logical canvas coordinates to pixels at one render scale"""
+    def __init__(self, logical_size, scale=1):
+        self.logical_size = logical_size
+        self.scale = scale
+        self.size = self.point(logical_size)
+
+    def length(self, value):
+        return int(round(value * self.scale))
+
+    def point(self, pos):
+        return self.length(pos[0]), self.length(pos[1])
+
+    def rect(self, rect):
+        """Scales the edges of a rect, so neighbouring rects still meet"""
+        if self.scale == 1:
+            return pygame.Rect(rect)
+        left, top = self.point(rect.topleft)
+        right, bottom = self.point(rect.bottomright)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def logical_point(self, pos):
+        """Maps a canvas pixel back to logical coordinates"""
+        if self.scale == 1:
+            return pos
+        return int(pos[0] / self.scale), int(pos[1] / self.scale)
+
+def fit_scale(target_size, logical_size):
+    """Largest render scale (in SCALE_STEP steps, at least 1) whose canvas fits the target"""
+    scale = min(target_size[0] / logical_size[0], target_size[1] / logical_size[1])
+    return max(1, math.floor(scale / SCALE_STEP) * SCALE_STEP)
+
+def desktop_size():
+    sizes = pygame.display.get_desktop_sizes()
+    return sizes[0] if sizes else None
+
+def open_display(mode, logical_size, render_scale=None):
+    """Open the window for a display mode; returns (canvas surface, Viewport)
+
+    render_scale defaults to 1 for a plain window and to the scale that
+    fills the desktop (or most of it, for a scaled window) otherwise.
+    """
+    if mode == "window":
+        flags = 0
+        render_scale = render_scale or 1
+    else:
+        # SCALED letterboxes the canvas into the window and maps mouse positions onto it
+        flags = pygame.SCALED | (pygame.FULLSCREEN if mode == "fullscreen" else pygame.RESIZABLE)
+        if render_scale is None:
+            desktop = desktop_size()
+            render_scale = 1
+            if desktop is not None:
+                fill = 1 if mode == "fullscreen" else WINDOW_FILL
+                render_scale = fit_scale((desktop[0] * fill, desktop[1] * fill), logical_size)
+    view = Viewport(logical_size, render_scale)
+    return pygame.display.set_mode(view.size, flags), view
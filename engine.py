@@ -0,0 +1,146 @@
+"""
+Hangman Game Engine
+
+This module holds the rules of the Hangman game with no dependency on pygame,
+so games can be played without a display or audio device.
+"""
+
+import random
+
+# Fallback categories if custom_words.py is not available
+DEFAULT_CATEGORIES = {
+    "AWS Compute": ["EC2", "LAMBDA", "FARGATE", "LIGHTSAIL", "BEANSTALK"],
+    "AWS Storage": ["S3", "EBS", "EFS", "GLACIER", "SNOWBALL"],
+    "AWS Database": ["RDS", "DYNAMODB", "AURORA", "REDSHIFT", "NEPTUNE"]
+}
+
+MAX_WRONG_GUESSES = 6
+
+# Guessable symbols; each one owns a bit in the word and guess masks
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALPHABET)}
+
+def letter_mask(word):
+    """Returns the bitmask of the guessable symbols in a word"""
+    mask = 0
+    for letter in word:
+        mask |= LETTER_BITS.get(letter, 0)
+    return mask
+
+def load_word_categories():
+    """Returns the AWS categories from custom_words.py, or the fallback categories"""
+    try:
+        from custom_words import get_custom_categories
+    except ImportError:
+        return dict(DEFAULT_CATEGORIES)
+    return dict(get_custom_categories())
+
+class HangmanEngine:
+    """Game rules and score for one player"""
+    __slots__ = (
+        "categories",
+        "rng",
+        "scheduler",
+        "category",
+        "word",
+        "word_index",
+        "word_mask",
+        "guess_mask",
+        "wrong_guesses",
+        "max_wrong_guesses",
+        "status",  # idle, playing, won, lost
+        "score",
+        "games_played",
+    )
+
+    def __init__(self, categories, max_wrong_guesses=MAX_WRONG_GUESSES, rng=None, scheduler=None):
+        # categories maps names to word lists with precomputed masks (see corpus.WordList)
+        self.categories = categories
+        self.rng = rng if rng is not None else random
+        # scheduler.WordScheduler for adaptive picks; None picks uniformly
+        self.scheduler = scheduler
+        self.category = ""
+        self.word = ""
+        self.word_index = -1  # Position in the category's word list, -1 for start_word
+        self.word_mask = 0
+        self.guess_mask = 0
+        self.wrong_guesses = 0
+        self.max_wrong_guesses = max_wrong_guesses
+        self.status = "idle"
+        self.score = 0
+        self.games_played = 0
+
+    def select_word(self, category):
+        """Start a new game with a random word from the category"""
+        words = self.categories[category]
+        if self.scheduler is not None:
+            index = self.scheduler.choose(category, self.rng)
+        else:
+            index = self.rng.randrange(len(words))
+        self.start_word(category, words[index], words.mask_at(index))
+        self.word_index = index
+
+    def start_word(self, category, word, mask=None):
+        """Start a new game with a given word"""
+        self.category = category
+        self.word = word
+        self.word_mask = mask if mask is not None else letter_mask(word)
+        self.word_index = -1
+        self.guess_mask = 0
+        self.wrong_guesses = 0
+        self.status = "playing"
+        self.games_played += 1
+
+    def check_guess(self, letter):
+        """Record a guess and return True if the letter is in the word"""
+        bit = LETTER_BITS[letter]
+        hit = bit & self.word_mask != 0
+        # Guesses after the game is decided, and repeated guesses, change nothing
+        if self.status != "playing" or bit & self.guess_mask:
+            return hit
+        self.guess_mask |= bit
+        if hit:
+            if self.is_word_guessed():
+                self.status = "won"
+                self.score += 1
+                self.schedule_outcome()
+            return True
+        self.wrong_guesses += 1
+        if self.wrong_guesses >= self.max_wrong_guesses:
+            self.status = "lost"
+            self.schedule_outcome()
+        return False
+
+    def schedule_outcome(self):
+        """Tell the scheduler how the player did on a picked word"""
+        if self.scheduler is not None and self.word_index >= 0:
+            self.scheduler.record(self.category, self.word_index, self.status == "won", self.wrong_guesses)
+
+    def is_word_guessed(self):
+        return self.word_mask & ~self.guess_mask == 0
+
+    def is_guessed(self, letter):
+        return LETTER_BITS[letter] & self.guess_mask != 0
+
+    def is_in_word(self, letter):
+        return LETTER_BITS[letter] & self.word_mask != 0
+
+    def masked_word(self):
+        """Returns the word with unguessed symbols replaced by underscores"""
+        display = ""
+        for letter in self.word:
+            bit = LETTER_BITS.get(letter)
+            if bit is None or bit & self.guess_mask:
+                display += letter + " "
+            else:
+                display += "_ "
+        return display
+
+    def is_over(self):
+        return self.status in ("won", "lost")
+
+    def reset(self):
+        """Clear the current game, keeping the score"""
+        self.guess_mask = 0
+        self.wrong_guesses = 0
+        self.status = "idle"
@@ -0,0 +1,166 @@
+"""
+Golden Image Tests for Hangman Game
+
+Renders every screen offscreen under SDL's dummy drivers: the menu, each
+category page, and for every word in every category each gallows stage
+plus the won and lost screens. Rendering is spread over a process pool,
+and each image is compared with a stored golden image, allowing a
+per-channel tolerance and a small share of differing pixels. Images that
+fail are written next to the goldens with the differing pixels in red.
+
+Requires NumPy (pip install numpy).
+
+Usage:
+    python golden.py --update       # Store the current rendering as golden
+    python golden.py                # Compare against the goldens
+"""
+
+import os
+
+# Must be set before pygame creates a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import hangman
+from corpus import load_corpus
+from engine import ALPHABET, MAX_WRONG_GUESSES
+from headless import FREQUENCY_ORDER
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+FAILURES_DIR = "failures"
+CHANNEL_TOLERANCE = 16  # Largest per-channel difference still counted as equal
+PIXEL_TOLERANCE = 0.001  # Share of pixels allowed to differ
+
+def slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "_", text).strip("_")
+
+def word_states(category, word, max_wrong_guesses):
+    """Returns (name, state) for every gallows stage of a word, then won and lost"""
+    letters = [letter for letter in dict.fromkeys(word) if letter in ALPHABET]
+    misses = [letter for letter in FREQUENCY_ORDER if letter not in letters]
+    prefix = f"{slug(category)}__{slug(word)}"
+    states = []
+    for stage in range(max_wrong_guesses):
+        # Reveal some letters as the stages go on, but never the whole word
+        hits = letters[:min(stage, len(letters) - 1)]
+        guesses = "".join(hits + misses[:stage])
+        states.append((f"{prefix}__stage{stage}", {"game_state": "playing", "category": category,
+                                                    "word": word, "guesses": guesses}))
+    states.append((f"{prefix}__won", {"game_state": "game_over", "category": category, "word": word,
+                                      "guesses": "".join(misses[:max_wrong_guesses - 1] + letters)}))
+    states.append((f"{prefix}__lost", {"game_state": "game_over", "category": category, "word": word,
+                                       "guesses": "".join(letters[:1] + misses[:max_wrong_guesses])}))
+    return states
+
+def state_matrix(corpus, max_wrong_guesses=MAX_WRONG_GUESSES):
+    """Returns (name, state) for every screen of the game"""
+    states = [("menu", {"game_state": "menu"})]
+    for page in range(corpus.page_count(hangman.CATEGORIES_PER_PAGE)):
+        states.append((f"categories__page{page}", {"game_state": "category_select", "page": page}))
+    for category in corpus.names:
+        words = corpus[category]
+        for index in range(len(words)):
+            states.extend(word_states(category, words[index], max_wrong_guesses))
+    return states
+
+def compare(image, golden, channel_tolerance):
+    """Returns the mask of pixels that differ by more than the tolerance"""
+    return (np.abs(image.astype(np.int16) - golden.astype(np.int16)) > channel_tolerance).any(axis=2)
+
+# Per-process game, created by the pool initializer
+game = None
+
+def start_worker(max_wrong_guesses):
+    global game
+    hangman.init_app()
+    hangman.preload_assets()
+    hangman.asset_loader.wait(None)
+    game = hangman.Hangman(max_wrong_guesses=max_wrong_guesses)
+
+def render_chunk(args):
+    """Render a chunk of states and store or check them; returns (name, result, differing share)"""
+    import pygame
+    states, golden_dir, update, channel_tolerance, pixel_tolerance = args
+    results = []
+    for name, state in states:
+        state = dict(state)
+        surface = game.render_state(state.pop("game_state"), **state)
+        path = os.path.join(golden_dir, name + ".png")
+        if update:
+            pygame.image.save(surface, path)
+            results.append((name, "saved", 0.0))
+            continue
+        if not os.path.exists(path):
+            results.append((name, "missing", 1.0))
+            continue
+        golden = pygame.image.load(path)
+        if golden.get_size() != surface.get_size():
+            results.append((name, "size", 1.0))
+            continue
+        # Most screens match exactly; only diff the ones that do not
+        if pygame.image.tobytes(golden, "RGB") == pygame.image.tobytes(surface, "RGB"):
+            results.append((name, "ok", 0.0))
+            continue
+        differs = compare(pygame.surfarray.pixels3d(surface), pygame.surfarray.array3d(golden), channel_tolerance)
+        share = float(differs.mean())
+        if share > pixel_tolerance:
+            failure = surface.copy()
+            pixels = pygame.surfarray.pixels3d(failure)
+            pixels[differs] = (255, 0, 0)
+            del pixels
+            pygame.image.save(failure, os.path.join(golden_dir, FAILURES_DIR, name + ".png"))
+            results.append((name, "FAILED", share))
+        else:
+            results.append((name, "ok", share))
+    return results
+
+def run(golden_dir, update, processes, channel_tolerance, pixel_tolerance, max_wrong_guesses):
+    states = state_matrix(load_corpus(), max_wrong_guesses)
+    os.makedirs(os.path.join(golden_dir, FAILURES_DIR), exist_ok=True)
+    processes = processes or os.cpu_count()
+    # A few chunks per process keeps the pool busy to the end
+    chunk_size = max(1, len(states) // (processes * 4))
+    chunks = [(states[i:i + chunk_size], golden_dir, update, channel_tolerance, pixel_tolerance)
+              for i in range(0, len(states), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=processes, initializer=start_worker,
+                             initargs=(max_wrong_guesses,)) as executor:
+        for chunk_results in executor.map(render_chunk, chunks):
+            results.extend(chunk_results)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every game screen and compare with golden images")
+    parser.add_argument("--update", action="store_true", help="Store the rendered images as the new goldens")
+    parser.add_argument("--golden-dir", default=GOLDEN_DIR)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--tolerance", type=int, default=CHANNEL_TOLERANCE, help="Per-channel difference allowed")
+    parser.add_argument("--max-diff", type=float, default=PIXEL_TOLERANCE, help="Share of pixels allowed to differ")
+    parser.add_argument("--max-wrong-guesses", type=int, default=MAX_WRONG_GUESSES)
+    args = parser.parse_args()
+    if args.max_wrong_guesses < 1:
+        parser.error("--max-wrong-guesses must be at least 1")
+
+    start = time.perf_counter()
+    results = run(args.golden_dir, args.update, args.processes, args.tolerance, args.max_diff, args.max_wrong_guesses)
+    seconds = time.perf_counter() - start
+
+    failures = [result for result in results if result[1] not in ("ok", "saved")]
+    for name, result, share in failures:
+        print(f"{name}: {result} ({share:.2%} of pixels differ)")
+    action = "Saved" if args.update else "Checked"
+    print(f"{action} {len(results)} screens in {seconds:.1f}s, {len(failures)} failed")
+    if failures:
+        print(f"Differences are marked in red in {os.path.join(args.golden_dir, FAILURES_DIR)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
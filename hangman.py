@@ -1,19 +1,23 @@
+import argparse
 import pygame
-import random
 import sys
+import time
 import os
-from pygame import mixer
+from collections import OrderedDict
 
-# Try to import custom words
-try:
-    from custom_words import get_custom_categories
-    has_custom_words = True
-except ImportError:
-    has_custom_words = False
+from assets import AssetLoader
+from audio import AudioEngine
+from corpus import load_corpus
+from display import DISPLAY_MODES, Viewport, open_display
+from profiler import FrameProfiler
+from scheduler import WordScheduler
+from sprites import SPRITE_AREA, HangmanSprites
+from engine import MAX_WRONG_GUESSES, HangmanEngine
+from hints import BackgroundHints
+from history import GameHistory, game_result
 
-# Initialize pygame
-pygame.init()
-mixer.init()
+# Reference point for the time-to-first-frame measurement
+STARTED_AT = time.perf_counter()
 
 # Constants
 SCREEN_WIDTH = 800
@@ -28,66 +32,238 @@ DARK_BLUE = (0, 0, 150)
 AWS_ORANGE = (255, 153, 0)
 AWS_BLUE = (35, 47, 62)
 
-# Create the screen
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("AWS Cloud Services Hangman Game")
+# Screen regions repainted in dirty-rect mode when the game state changes
+HANGMAN_AREA = SPRITE_AREA
+WORD_AREA = pygame.Rect(0, 270, SCREEN_WIDTH, 60)
+GUESSES_AREA = pygame.Rect(SCREEN_WIDTH - 300, 15, 300, 35)
+MAX_DIRTY_RECTS = 16  # Above this many regions a full flip is cheaper
 
-# Load background images
+# Frame profiler HUD (F3 toggles it, F4 exports the recorded frames)
+HUD_RECT = pygame.Rect(0, 0, 420, 44)
+HUD_REFRESH_FRAMES = 15  # Recompute the HUD statistics this often
+PROFILE_CSV = "hangman_profile.csv"
+PROFILE_TRACE = "hangman_trace.json"
+
+# Category buttons per page; reduced from 4 to 3 to accommodate larger buttons
+CATEGORIES_PER_PAGE = 3
+
+# Hit-testing grid cell size; matches the letter keyboard pitch
+HIT_CELL_SIZE = 50
+
+# Frame pacing
+MAX_FPS = 60  # Frame-rate cap while handling input or showing the HUD (0 = uncapped)
+IDLE_WAIT_MS = 250  # Longest time to block on the event queue while idle
+
+# Posted by the word list watcher thread when reloaded categories are ready
+WORDS_CHANGED = pygame.USEREVENT
+# Posted by the hint worker when a requested hint is ready
+HINT_READY = pygame.USEREVENT + 1
+
+# Set by init_app(); nothing touches the display until then
+screen = None
+
+# Logical-to-canvas mapping; layout is always in 800x600 logical coordinates,
+# and the canvas is rasterized at view.scale times that
+view = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+IMAGES_DIR = os.path.join(os.path.dirname(__file__), "images")
+SOUNDS_DIR = os.path.join(os.path.dirname(__file__), "sounds")
+
+def init_app(display_mode="window", render_scale=None):
+    """Initialize pygame and open the game window"""
+    global screen, view
+    # Only the subsystems needed for the first frame; preload_assets() starts the mixer
+    pygame.display.init()
+    pygame.font.init()
+    screen, view = open_display(display_mode, (SCREEN_WIDTH, SCREEN_HEIGHT), render_scale)
+    pygame.display.set_caption("AWS Cloud Services Hangman Game")
+    return screen
+
+# Images and sounds are decoded on worker threads; scaled images are cached on disk
+asset_loader = AssetLoader()
+
+# Small mixer buffer and reserved channels per effect; tones stand in for missing files
+audio = AudioEngine()
+
+BACKGROUND_PATH = os.path.join(IMAGES_DIR, "aws_bg.jpg")
+SOUND_FILES = ["correct.mp3", "wrong.mp3", "win.mp3", "lose.mp3"]
+# Synthesized tone (see audio.TONES) used when a sound file is missing
+SOUND_EFFECTS = {"correct.mp3": "correct", "wrong.mp3": "wrong", "win.mp3": "win", "lose.mp3": "lose"}
+
+def preload_assets():
+    """Start decoding the background and sound effects in parallel"""
+    if os.path.exists(BACKGROUND_PATH):
+        asset_loader.load_image(background_name(), BACKGROUND_PATH, view.size)
+    if not audio.start():
+        return  # No audio device; sounds fall back to silence when played
+    for filename in SOUND_FILES:
+        path = os.path.join(SOUNDS_DIR, filename)
+        if os.path.exists(path):
+            asset_loader.load_sound(filename, path)
+        else:
+            # Synthesize now rather than on the first guess
+            audio.tone(SOUND_EFFECTS[filename])
+
+def show_splash():
+    """Draw a loading screen until the preloaded assets are ready"""
+    splash_font = pygame.font.Font(None, view.length(48))  # Built-in font, no system font lookup
+    screen.fill(AWS_BLUE)
+    text = splash_font.render("Loading...", True, AWS_ORANGE)
+    screen.blit(text, text.get_rect(center=view.point((SCREEN_WIDTH//2, SCREEN_HEIGHT//2))))
+    pygame.display.flip()
+    # Keep the window responsive while waiting
+    while not asset_loader.wait(1 / 60):
+        pygame.event.pump()
+    
+    report = asset_loader.report()
+    print(f"Assets loaded in {report['wall_ms']:.0f} ms "
+          f"(image cache: {report['cache_hits']} hits, {report['cache_misses']} misses)")
+
+# Background images per render scale, loaded on first use
 background_images = {}
-background_images["main"] = None
-try:
-    # Load background image from local file
-    images_dir = os.path.join(os.path.dirname(__file__), "images")
-    bg_path = os.path.join(images_dir, "aws_bg.jpg")
-    if os.path.exists(bg_path):
-        background_images["main"] = pygame.image.load(bg_path)
-        background_images["main"] = pygame.transform.scale(background_images["main"], (SCREEN_WIDTH, SCREEN_HEIGHT))
-        print("Background image loaded successfully.")
-    else:
-        print("Background image not found. Place an image named 'aws_bg.jpg' in the 'images' folder.")
-except Exception as e:
-    print(f"Error loading background image: {e}")
-
-# Create a semi-transparent overlay for better text readability
-overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-overlay.fill((255, 255, 255, 180))  # White with 70% opacity
+
+def background_name():
+    """Asset name of the background scaled for the current canvas"""
+    return "background" if view.scale == 1 else f"background@{view.size[0]}x{view.size[1]}"
+
+def get_background():
+    """Return the display-format background image, or None if it is unavailable"""
+    key = ("main", view.scale)
+    if key not in background_images:
+        background_images[key] = None
+        if os.path.exists(BACKGROUND_PATH):
+            # Decoded and scaled once per canvas size, already in the display pixel
+            # format, so blits skip per-frame conversion and rescaling
+            background_images[key] = asset_loader.image(background_name(), BACKGROUND_PATH, view.size)
+            if background_images[key]:
+                print("Background image loaded successfully.")
+        else:
+            print("Background image not found. Place an image named 'aws_bg.jpg' in the 'images' folder.")
+    return background_images[key]
+
+def get_overlay():
+    """Return the semi-transparent overlay used for better text readability"""
+    key = ("overlay", view.scale)
+    if key not in background_images:
+        overlay = pygame.Surface(view.size, pygame.SRCALPHA)
+        overlay.fill((255, 255, 255, 180))  # White with 70% opacity
+        background_images[key] = overlay.convert_alpha()
+    return background_images[key]
+
+class LazyFont:
+    """System font that is only looked up the first time it is used at each render scale"""
+    def __init__(self, name, point_size):
+        self.name = name
+        self.point_size = point_size
+        self.fonts = {}  # Render scale -> font rasterized at point_size * scale
+    
+    def load(self):
+        font = self.fonts.get(view.scale)
+        if font is None:
+            font = pygame.font.SysFont(self.name, view.length(self.point_size))
+            self.fonts[view.scale] = font
+        return font
+    
+    def __getattr__(self, attr):
+        # Forward render, size, get_height, ... to the real font
+        if attr == "fonts" or attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+class TextCache:
+    """Size-bounded LRU cache of rendered text surfaces"""
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+    
+    def stats(self):
+        """Return the hit/miss/eviction counters and current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.surfaces),
+        }
+    
+    def clear(self):
+        self.surfaces.clear()
 
 # Fonts
-font = pygame.font.SysFont('Arial', 32)
-small_font = pygame.font.SysFont('Arial', 24)
-letter_font = pygame.font.SysFont('Arial', 40)
-title_font = pygame.font.SysFont('Arial', 50)
-
-# Word categories
-word_categories = {
-    # Default categories will be replaced by AWS categories from custom_words.py
-}
-
-# Add AWS categories
-if has_custom_words:
-    custom_categories = get_custom_categories()
-    word_categories.update(custom_categories)
-else:
-    # Fallback categories if custom_words.py is not available
-    word_categories = {
-        "AWS Compute": ["EC2", "LAMBDA", "FARGATE", "LIGHTSAIL", "BEANSTALK"],
-        "AWS Storage": ["S3", "EBS", "EFS", "GLACIER", "SNOWBALL"],
-        "AWS Database": ["RDS", "DYNAMODB", "AURORA", "REDSHIFT", "NEPTUNE"]
-    }
+font = LazyFont('Arial', 32)
+small_font = LazyFont('Arial', 24)
+letter_font = LazyFont('Arial', 40)
+title_font = LazyFont('Arial', 50)
+hud_font = LazyFont(None, 20)
+
+# Shared cache for every piece of text drawn by the game
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color):
+    """Render text at the current render scale through the shared LRU cache (surfaces must not be modified)"""
+    return text_cache.render(font.load(), text, antialias, color)
+
+class SilentSound:
+    """Stand-in used when a sound effect can't be loaded"""
+    def play(self):
+        return None
+
+class LazySound:
+    """Sound effect resolved on first play: the decoded file, or a synthesized tone"""
+    warned = False
+    
+    def __init__(self, filename):
+        self.filename = filename
+        self.sound = None
+    
+    def load(self):
+        if self.sound is None:
+            path = os.path.join(SOUNDS_DIR, self.filename)
+            try:
+                if audio.start():
+                    if os.path.exists(path):
+                        self.sound = asset_loader.sound(self.filename, path)
+                    else:
+                        self.sound = audio.tone(SOUND_EFFECTS[self.filename])
+            except pygame.error:
+                pass
+            if self.sound is None:
+                # If the sound (or the audio device) can't be loaded, use a silent dummy sound
+                self.sound = SilentSound()
+                if not LazySound.warned:
+                    LazySound.warned = True
+                    print("Warning: Sound effects unavailable. Playing without sound effects.")
+        return self.sound
+    
+    def play(self):
+        sound = self.load()
+        if isinstance(sound, SilentSound):
+            return None
+        return audio.play(self.filename, sound)
 
 # Sound effects
-try:
-    correct_sound = pygame.mixer.Sound(os.path.join(os.path.dirname(__file__), "sounds", "correct.mp3"))
-    wrong_sound = pygame.mixer.Sound(os.path.join(os.path.dirname(__file__), "sounds", "wrong.mp3"))
-    win_sound = pygame.mixer.Sound(os.path.join(os.path.dirname(__file__), "sounds", "win.mp3"))
-    lose_sound = pygame.mixer.Sound(os.path.join(os.path.dirname(__file__), "sounds", "lose.mp3"))
-except:
-    # If sounds can't be loaded, create dummy sounds
-    correct_sound = pygame.mixer.Sound(buffer=bytearray(100))
-    wrong_sound = pygame.mixer.Sound(buffer=bytearray(100))
-    win_sound = pygame.mixer.Sound(buffer=bytearray(100))
-    lose_sound = pygame.mixer.Sound(buffer=bytearray(100))
-    print("Warning: Sound files not found. Creating game without sound effects.")
+correct_sound = LazySound("correct.mp3")
+wrong_sound = LazySound("wrong.mp3")
+win_sound = LazySound("win.mp3")
+lose_sound = LazySound("lose.mp3")
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color, text_color=BLACK, font=font):
@@ -97,84 +273,184 @@ class Button:
         self.hover_color = hover_color
         self.text_color = text_color
         self.current_color = color
+        self.enabled = True  # Disabled buttons are skipped by hit-testing
+        self.dirty = False  # Set when the button needs repainting in dirty-rect mode
         self.font = font
-        self.text_surface = self.font.render(text, True, text_color)
-        self.text_rect = self.text_surface.get_rect(center=self.rect.center)
+        self.text_surface = render_text(self.font, text, True, text_color)
+        self.text_scale = view.scale
         
     def draw(self, surface):
-        pygame.draw.rect(surface, self.current_color, self.rect, border_radius=10)
-        pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=10)
-        surface.blit(self.text_surface, self.text_rect)
+        # rect is in logical coordinates; the label is re-rendered if the render scale changed
+        rect = view.rect(self.rect)
+        if self.text_scale != view.scale:
+            self.text_surface = render_text(self.font, self.text, True, self.text_color)
+            self.text_scale = view.scale
+        pygame.draw.rect(surface, self.current_color, rect, border_radius=view.length(10))
+        pygame.draw.rect(surface, BLACK, rect, view.length(2), border_radius=view.length(10))
+        surface.blit(self.text_surface, self.text_surface.get_rect(center=rect.center))
         
-    def check_hover(self, pos):
-        if self.rect.collidepoint(pos):
-            self.current_color = self.hover_color
-        else:
-            self.current_color = self.color
+    def set_hover(self, hovered):
+        self.set_color(self.hover_color if hovered else self.color)
+    
+    def set_color(self, color):
+        if color != self.current_color:
+            self.current_color = color
+            self.dirty = True
             
-    def is_clicked(self, pos, event):
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(pos):
-                return True
-        return False
-        
     def update_text(self, new_text):
-        """Update the button text and recalculate text position"""
+        """Update the button text and re-render its label"""
         self.text = new_text
-        self.text_surface = self.font.render(new_text, True, self.text_color)
-        self.text_rect = self.text_surface.get_rect(center=self.rect.center)
+        self.text_surface = render_text(self.font, new_text, True, self.text_color)
+        self.text_scale = view.scale
+        self.dirty = True
+
+def to_logical(events):
+    """Map mouse positions from canvas pixels to logical coordinates, in place"""
+    if view.scale != 1:
+        for event in events:
+            if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                event.pos = view.logical_point(event.pos)
+    return events
+
+class HitGrid:
+    """Uniform grid mapping screen cells to the buttons overlapping them, for O(1) hit-testing"""
+    def __init__(self, buttons, cell_size=HIT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        for button in buttons:
+            rect = button.rect
+            for cell_x in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                for cell_y in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                    self.cells.setdefault((cell_x, cell_y), []).append(button)
+    
+    def button_at(self, pos):
+        """Return the enabled button under pos, or None"""
+        for button in self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size), ()):
+            if button.enabled and button.rect.collidepoint(pos):
+                return button
+        return None
+
+def post_hint_ready(future):
+    # Runs on the hint worker; wakes the frame loop, which reads the answer
+    if pygame.display.get_init():
+        pygame.event.post(pygame.event.Event(HINT_READY))
 
 class Hangman:
-    def __init__(self):
+    def __init__(self, dirty_rect_mode=True, max_fps=MAX_FPS, idle_wait_ms=IDLE_WAIT_MS, corpus=None, engine=None, profile=False,
+                 max_wrong_guesses=MAX_WRONG_GUESSES, antialias=False, history=None):
         self.game_state = "menu"  # menu, category_select, playing, game_over
-        self.word = ""
-        self.category = ""
-        self.guessed_letters = set()
-        self.wrong_guesses = 0
-        self.max_wrong_guesses = 6
-        self.score = 0
-        self.games_played = 0
+        # Word categories (AWS categories from custom_words.py plus any word list files)
+        self.corpus = corpus if corpus is not None else load_corpus()
+        # Local rules by default, picking words adaptively from the player's
+        # miss history; a remote.RemoteEngine plays against a game server
+        local = engine is None
+        if local:
+            engine = HangmanEngine(self.corpus, max_wrong_guesses, scheduler=WordScheduler(self.corpus, history))
+        self.engine = engine
+        self.word_display_key = None
+        self.word_display = ""
+        
+        # Finished games go to history.GameHistory, which also restores the score
+        self.history = history
+        self.word_started = 0.0
+        if history is not None and local:
+            self.engine.games_played, self.engine.score = history.totals["total"][:2]
+        
+        # replay.ReplayRecorder capturing the input events of each frame
+        self.recorder = None
+        
+        # watcher.CorpusWatcher whose reloaded word lists are applied between frames
+        self.watcher = None
+        
+        # Errors of a remote engine that end the round instead of the game, and the
+        # message about the last one shown on the menu
+        self.engine_errors = ()
+        self.notice = None
+        
         self.current_page = 0  # For category pagination
-        self.categories_per_page = 3  # Reduced from 4 to 3 to accommodate larger buttons
+        self.categories_per_page = CATEGORIES_PER_PAGE
+        
+        # Dirty-rect rendering: only changed regions are repainted and pushed to the display
+        self.dirty_rect_mode = dirty_rect_mode
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.presented_state = None
+        
+        # Idle-aware frame pacing: block on the event queue when nothing needs drawing
+        self.max_fps = max_fps
+        self.idle_wait_ms = idle_wait_ms
+        self.mode_time = {"active": 0.0, "idle": 0.0}
+        self.dequeued_at = None  # When the events being handled were taken off the queue
+        self.first_frame_ms = None
+        
+        # Frame profiler; None means no instrumentation at all
+        self.profiler = FrameProfiler() if profile else None
+        self.export_profile_on_exit = profile
+        self.show_hud = False
+        self.hud_lines = []
+        
+        # Gallows sprite sheets per (miss budget, anti-aliasing, render scale)
+        self.antialias = antialias
+        self.hangman_sprites = {}
+        
+        # Pre-composited background + overlay + static text: game state -> (key, surface),
+        # so each screen keeps only the layer for its current category, page and scale
+        self.static_layers = {}
         
         # Create buttons
         self.play_button = Button(300, 250, 200, 60, "Play Game", GREEN, (100, 255, 100))
         self.menu_button = Button(300, 450, 200, 60, "Main Menu", WHITE, (45, 57, 72))
         self.play_again_button = Button(300, 350, 200, 60, "Play Again", GREEN, (100, 255, 100))
         
+        # Game over buttons are centered with extra spacing
+        self.play_again_button.rect.center = (SCREEN_WIDTH // 2, 350)
+        self.menu_button.rect.center = (SCREEN_WIDTH // 2, 450)
+        
         # Navigation buttons for categories
         self.prev_button = Button(200, 500, 100, 40, "Previous", AWS_ORANGE, (45, 57, 72), font=small_font)
         self.next_button = Button(500, 500, 100, 40, "Next", AWS_ORANGE, (45, 57, 72), font=small_font)
         
-        # Create category buttons
+        # Category buttons are created once and relabelled for each page
+        self.category_button_pool = [
+            Button(0, 0, 350, 60, "", AWS_BLUE, (45, 57, 72), text_color=WHITE, font=font)
+            for _ in range(self.categories_per_page)
+        ]
         self.category_buttons = []
-        self.create_category_buttons()
+        self.layout_category_buttons()
+        
+        # Hit-testing grids per screen layout, and coalesced hover state
+        self.hit_grids = {}
+        self.hover_pos = None  # Latest pointer position not yet applied to hover colors
+        self.pointer_pos = None
+        self.hovered = None
+        self.hover_layout = None
         
         # Create letter buttons
         self.letter_buttons = []
         self.create_letter_buttons()
         
-    def create_category_buttons(self):
-        self.category_buttons = []
-        categories = list(word_categories.keys())
-        start_idx = self.current_page * self.categories_per_page
-        end_idx = min(start_idx + self.categories_per_page, len(categories))
+        # Hint button suggests the letter that best narrows down the candidate words;
+        # tables are built and followed on a worker thread: all of them once run()
+        # starts, otherwise each when a game first needs it
+        self.hints = BackgroundHints(self.corpus)
+        self.hint_future = None  # Hint being worked out for the current guesses
+        self.hint_button = Button(580, 150, 140, 40, "Hint", AWS_ORANGE, (45, 57, 72), font=small_font)
+        self.playing_buttons = self.letter_buttons + [self.hint_button]
+        
+    def layout_category_buttons(self):
+        """Label and position the pooled category buttons for the current page"""
+        categories = self.corpus.page(self.current_page, self.categories_per_page)
+        self.category_buttons = self.category_button_pool[:len(categories)]
         
         # Center the buttons vertically based on how many we have
-        total_height = (end_idx - start_idx) * 80  # 80px per button with spacing
+        total_height = len(categories) * 80  # 80px per button with spacing
         start_y = (SCREEN_HEIGHT - total_height) // 2
         
-        for i in range(start_idx, end_idx):
-            y_pos = start_y + (i - start_idx) * 80
-            category = categories[i]
-            # Make category buttons wider and taller
-            button = Button(SCREEN_WIDTH//2, y_pos, 350, 60, category, AWS_BLUE, (45, 57, 72), text_color=WHITE, font=font)
-            
+        for i, (button, category) in enumerate(zip(self.category_buttons, categories)):
             # Center the button horizontally
-            button.rect.centerx = SCREEN_WIDTH // 2
-            button.text_rect.centerx = button.rect.centerx
-            
-            self.category_buttons.append(button)
+            button.rect.topleft = (SCREEN_WIDTH//2 - button.rect.width//2, start_y + i * 80)
+            button.update_text(category)
+            button.set_color(button.color)
         
     def create_letter_buttons(self):
         self.letter_buttons = []
@@ -193,124 +469,171 @@ class Hangman:
         y_pos = 500
         for i, letter in enumerate("UVWXYZ"):
             self.letter_buttons.append(Button(x_start + i*50 + 100, y_pos, 40, 40, letter, GRAY, (220, 220, 220), font=small_font))
+        
+        # Fourth row (0-9) for service names such as EC2, S3 and ROUTE53
+        y_pos = 550
+        for i, letter in enumerate("0123456789"):
+            self.letter_buttons.append(Button(x_start + i*50, y_pos, 40, 40, letter, GRAY, (220, 220, 220), font=small_font))
+    
+    # Game state lives in the engine; these are read-only views for drawing
+    word = property(lambda self: self.engine.word)
+    category = property(lambda self: self.engine.category)
+    wrong_guesses = property(lambda self: self.engine.wrong_guesses)
+    max_wrong_guesses = property(lambda self: self.engine.max_wrong_guesses)
+    score = property(lambda self: self.engine.score)
+    games_played = property(lambda self: self.engine.games_played)
     
     def select_word(self, category):
-        self.category = category
-        self.word = random.choice(word_categories[category])
-        self.guessed_letters = set()
-        self.wrong_guesses = 0
+        self.engine.select_word(category)
+        self.word_started = time.perf_counter()
+        self.clear_hint()
+        # Queued on the hint worker, ahead of the tables of other categories
+        self.hints.follow(self.engine)
+    
+    def show_hint(self):
+        """Ask the hint worker for a letter; the button is relabelled when the answer arrives"""
+        self.hint_button.update_text("Thinking...")
+        self.hint_future = self.hints.hint(self.engine)
+        self.hint_future.add_done_callback(post_hint_ready)
+    
+    def apply_hint(self):
+        # Answers to hints asked before the latest guess are dropped
+        future = self.hint_future
+        if future is None or not future.done():
+            return
+        self.hint_future = None
+        letter = None if future.cancelled() or future.exception() is not None else future.result()
+        self.hint_button.update_text(f"Try {letter}" if letter is not None else "No hint")
+    
+    def clear_hint(self):
+        self.hint_future = None
+        if self.hint_button.text != "Hint":
+            self.hint_button.update_text("Hint")
+    
+    def record_game(self):
+        if self.history is not None:
+            self.history.record(game_result(self.engine, time.perf_counter() - self.word_started))
     
     def check_guess(self, letter):
-        self.guessed_letters.add(letter)
-        if letter in self.word:
+        if self.engine.check_guess(letter):
             correct_sound.play()
             return True
         else:
-            self.wrong_guesses += 1
             wrong_sound.play()
             return False
     
     def is_word_guessed(self):
-        return all(letter in self.guessed_letters for letter in self.word)
+        return self.engine.is_word_guessed()
     
     def draw_hangman(self):
-        # Base
-        pygame.draw.line(screen, BLACK, (150, 350), (250, 350), 5)
+        # All stages are pre-rendered; the current one is a single blit
+        key = (self.max_wrong_guesses, self.antialias, view.scale)
+        sprites = self.hangman_sprites.get(key)
+        if sprites is None:
+            sprites = HangmanSprites(self.max_wrong_guesses, BLACK, self.antialias, view.scale)
+            self.hangman_sprites[key] = sprites
+        sprites.draw(screen, self.wrong_guesses)
+    
+    def draw_word(self):
+        # The masked word only changes when the word or the guesses change
+        key = (self.engine.word, self.engine.guess_mask)
+        if key != self.word_display_key:
+            self.word_display = self.engine.masked_word()
+            self.word_display_key = key
+        word_display = self.word_display
+        
+        word_surface = render_text(letter_font, word_display, True, BLACK)
+        word_rect = word_surface.get_rect(center=view.point((SCREEN_WIDTH//2, 300)))
+        screen.blit(word_surface, word_rect)
+    
+    def static_layer_key(self):
+        """Return the cache key for the static layer of the current screen"""
+        if self.game_state == "category_select":
+            return (self.game_state, self.current_page, len(self.corpus))
+        elif self.game_state == "playing":
+            return (self.game_state, self.category)
+        return (self.game_state,)
+    
+    def build_static_layer(self):
+        """Compose background, overlay and static text for the current screen into one surface"""
+        layer = pygame.Surface(view.size).convert()
         
-        # Pole
-        if self.wrong_guesses >= 1:
-            pygame.draw.line(screen, BLACK, (200, 350), (200, 100), 5)
+        # Draw background if available
+        background = get_background()
+        if background:
+            layer.blit(background, (0, 0))
+            layer.blit(get_overlay(), (0, 0))
+        else:
+            layer.fill(WHITE)
         
-        # Top beam
-        if self.wrong_guesses >= 2:
-            pygame.draw.line(screen, BLACK, (200, 100), (300, 100), 5)
+        if self.game_state == "menu":
+            title = render_text(title_font, "AWS Cloud Services", True, AWS_BLUE)
+            subtitle = render_text(font, "Hangman Game", True, AWS_ORANGE)
+            layer.blit(title, title.get_rect(midtop=view.point((SCREEN_WIDTH//2, 120))))
+            layer.blit(subtitle, subtitle.get_rect(midtop=view.point((SCREEN_WIDTH//2, 180))))
         
-        # Rope
-        if self.wrong_guesses >= 3:
-            pygame.draw.line(screen, BLACK, (300, 100), (300, 150), 5)
+        elif self.game_state == "category_select":
+            title = render_text(font, "Select an AWS Category", True, AWS_BLUE)
+            layer.blit(title, title.get_rect(midtop=view.point((SCREEN_WIDTH//2, 80))))
+            
+            # Draw AWS logo text
+            aws_text = render_text(font, "AWS Cloud Services Hangman", True, AWS_ORANGE)
+            layer.blit(aws_text, aws_text.get_rect(midtop=view.point((SCREEN_WIDTH//2, 40))))
+            
+            # Draw pagination info
+            total_pages = self.corpus.page_count(self.categories_per_page)
+            page_text = render_text(small_font, f"Page {self.current_page + 1}/{total_pages}", True, BLACK)
+            layer.blit(page_text, page_text.get_rect(midtop=view.point((SCREEN_WIDTH//2, 520))))
         
-        # Head
-        if self.wrong_guesses >= 4:
-            pygame.draw.circle(screen, BLACK, (300, 170), 20, 3)
+        elif self.game_state == "playing":
+            # Draw category
+            category_text = render_text(font, f"Category: {self.category}", True, AWS_BLUE)
+            layer.blit(category_text, view.point((20, 20)))
+            
+            # Draw AWS logo text
+            aws_text = render_text(small_font, "AWS Cloud Services", True, AWS_ORANGE)
+            layer.blit(aws_text, aws_text.get_rect(midtop=view.point((SCREEN_WIDTH//2, 50))))
         
-        # Body
-        if self.wrong_guesses >= 5:
-            pygame.draw.line(screen, BLACK, (300, 190), (300, 250), 3)
-            # Arms
-            pygame.draw.line(screen, BLACK, (300, 210), (270, 230), 3)
-            pygame.draw.line(screen, BLACK, (300, 210), (330, 230), 3)
+        elif self.game_state == "game_over":
+            # Draw AWS logo text
+            aws_text = render_text(font, "AWS Cloud Services", True, AWS_ORANGE)
+            layer.blit(aws_text, aws_text.get_rect(midtop=view.point((SCREEN_WIDTH//2, 80))))
         
-        # Legs
-        if self.wrong_guesses >= 6:
-            pygame.draw.line(screen, BLACK, (300, 250), (270, 300), 3)
-            pygame.draw.line(screen, BLACK, (300, 250), (330, 300), 3)
+        return layer
     
-    def draw_word(self):
-        word_display = ""
-        for letter in self.word:
-            if letter in self.guessed_letters:
-                word_display += letter + " "
-            else:
-                word_display += "_ "
-        
-        word_surface = letter_font.render(word_display, True, BLACK)
-        word_rect = word_surface.get_rect(center=(SCREEN_WIDTH//2, 300))
-        screen.blit(word_surface, word_rect)
+    def draw_static_layer(self):
+        """Blit the cached static layer for the current screen, rebuilding it when its key changes"""
+        key = (view.scale, self.static_layer_key())
+        cached = self.static_layers.get(self.game_state)
+        if cached is None or cached[0] != key:
+            cached = (key, self.build_static_layer())
+            self.static_layers[self.game_state] = cached
+        screen.blit(cached[1], (0, 0))
     
     def draw_menu(self):
-        # Draw background if available
-        if background_images["main"]:
-            screen.blit(background_images["main"], (0, 0))
-            screen.blit(overlay, (0, 0))
-        else:
-            screen.fill(WHITE)
-            
-        title = title_font.render("AWS Cloud Services", True, AWS_BLUE)
-        subtitle = font.render("Hangman Game", True, AWS_ORANGE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 120))
-        screen.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 180))
+        # Background and titles come pre-composited from the static layer
+        self.draw_static_layer()
         self.play_button.draw(screen)
+        if self.notice:
+            notice_text = render_text(small_font, self.notice, True, RED)
+            screen.blit(notice_text, notice_text.get_rect(midtop=view.point((SCREEN_WIDTH//2, 330))))
     
     def draw_category_select(self):
-        # Draw background if available
-        if background_images["main"]:
-            screen.blit(background_images["main"], (0, 0))
-            screen.blit(overlay, (0, 0))
-        else:
-            screen.fill(WHITE)
-            
-        title = font.render("Select an AWS Category", True, AWS_BLUE)
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
-        
-        # Draw AWS logo text
-        aws_text = font.render("AWS Cloud Services Hangman", True, AWS_ORANGE)
-        screen.blit(aws_text, (SCREEN_WIDTH//2 - aws_text.get_width()//2, 40))
+        # Background, titles and pagination info come from the static layer
+        self.draw_static_layer()
         
         for button in self.category_buttons:
             button.draw(screen)
-            
-        # Draw pagination info
-        total_pages = (len(word_categories) + self.categories_per_page - 1) // self.categories_per_page
-        page_text = small_font.render(f"Page {self.current_page + 1}/{total_pages}", True, BLACK)
-        screen.blit(page_text, (SCREEN_WIDTH//2 - page_text.get_width()//2, 520))
         
         # Draw navigation buttons if needed
         if self.current_page > 0:
             self.prev_button.draw(screen)
-        if (self.current_page + 1) * self.categories_per_page < len(word_categories):
+        if (self.current_page + 1) * self.categories_per_page < len(self.corpus):
             self.next_button.draw(screen)
     
     def draw_game(self):
-        # Draw background if available
-        if background_images["main"]:
-            screen.blit(background_images["main"], (0, 0))
-            screen.blit(overlay, (0, 0))
-        else:
-            screen.fill(WHITE)
-        
-        # Draw category
-        category_text = font.render(f"Category: {self.category}", True, AWS_BLUE)
-        screen.blit(category_text, (20, 20))
+        # Background, category and AWS logo text come from the static layer
+        self.draw_static_layer()
         
         # Draw hangman
         self.draw_hangman()
@@ -319,151 +642,568 @@ class Hangman:
         self.draw_word()
         
         # Draw guesses left
-        guesses_text = small_font.render(f"Guesses Left: {self.max_wrong_guesses - self.wrong_guesses}", True, BLACK)
-        screen.blit(guesses_text, (SCREEN_WIDTH - guesses_text.get_width() - 20, 20))
+        guesses_text = render_text(small_font, f"Guesses Left: {self.max_wrong_guesses - self.wrong_guesses}", True, BLACK)
+        screen.blit(guesses_text, guesses_text.get_rect(topright=view.point((SCREEN_WIDTH - 20, 20))))
         
-        # Draw AWS logo text
-        aws_text = small_font.render("AWS Cloud Services", True, AWS_ORANGE)
-        screen.blit(aws_text, (SCREEN_WIDTH//2 - aws_text.get_width()//2, 50))
+        self.hint_button.draw(screen)
         
         # Draw letter buttons
         for button in self.letter_buttons:
             # If letter has been guessed, disable the button
-            if button.text in self.guessed_letters:
-                if button.text in self.word:
+            if self.engine.is_guessed(button.text):
+                if self.engine.is_in_word(button.text):
                     button.current_color = GREEN
                 else:
                     button.current_color = RED
             button.draw(screen)
     
     def draw_game_over(self):
-        # Draw background if available
-        if background_images["main"]:
-            screen.blit(background_images["main"], (0, 0))
-            screen.blit(overlay, (0, 0))
-        else:
-            screen.fill(WHITE)
+        # Background and AWS logo text come from the static layer
+        self.draw_static_layer()
         
         if self.is_word_guessed():
-            result_text = title_font.render("You Win!", True, GREEN)
+            result_text = render_text(title_font, "You Win!", True, GREEN)
         else:
-            result_text = title_font.render("Game Over", True, RED)
+            result_text = render_text(title_font, "Game Over", True, RED)
         
-        screen.blit(result_text, (SCREEN_WIDTH//2 - result_text.get_width()//2, 120))
+        screen.blit(result_text, result_text.get_rect(midtop=view.point((SCREEN_WIDTH//2, 120))))
         
-        # Draw AWS logo text
-        aws_text = font.render("AWS Cloud Services", True, AWS_ORANGE)
-        screen.blit(aws_text, (SCREEN_WIDTH//2 - aws_text.get_width()//2, 80))
+        word_text = render_text(font, f"The service was: {self.word}", True, AWS_BLUE)
+        screen.blit(word_text, word_text.get_rect(midtop=view.point((SCREEN_WIDTH//2, 200))))
         
-        word_text = font.render(f"The service was: {self.word}", True, AWS_BLUE)
-        screen.blit(word_text, (SCREEN_WIDTH//2 - word_text.get_width()//2, 200))
+        score_text = render_text(font, f"Score: {self.score}/{self.games_played}", True, BLACK)
+        screen.blit(score_text, score_text.get_rect(midtop=view.point((SCREEN_WIDTH//2, 250))))
         
-        score_text = font.render(f"Score: {self.score}/{self.games_played}", True, BLACK)
-        screen.blit(score_text, (SCREEN_WIDTH//2 - score_text.get_width()//2, 250))
+        self.play_again_button.draw(screen)
+        self.menu_button.draw(screen)
+    
+    def visible_buttons(self):
+        """Return the buttons shown in the current game state"""
+        if self.game_state == "menu":
+            return [self.play_button]
+        elif self.game_state == "category_select":
+            buttons = list(self.category_buttons)
+            if self.current_page > 0:
+                buttons.append(self.prev_button)
+            if (self.current_page + 1) * self.categories_per_page < len(self.corpus):
+                buttons.append(self.next_button)
+            return buttons
+        elif self.game_state == "playing":
+            return self.playing_buttons
+        elif self.game_state == "game_over":
+            return [self.play_again_button, self.menu_button]
+        return []
+    
+    def draw_screen(self):
+        """Draw the full frame for the current game state"""
+        if self.game_state == "menu":
+            self.draw_menu()
+        elif self.game_state == "category_select":
+            self.draw_category_select()
+        elif self.game_state == "playing":
+            self.draw_game()
+        elif self.game_state == "game_over":
+            self.draw_game_over()
+    
+    def mark_dirty(self, *rects):
+        """Queue screen regions to be repainted on the next frame"""
+        self.dirty_rects.extend(rects)
+    
+    def request_full_redraw(self):
+        """Repaint and flip the whole screen on the next frame"""
+        self.full_redraw = True
+    
+    def present(self):
+        """Push the current frame to the display, repainting only what changed"""
+        # A new game state always starts from a full frame
+        if self.game_state != self.presented_state:
+            self.full_redraw = True
+            self.presented_state = self.game_state
         
-        # Update button positions for better spacing
-        self.play_again_button.rect.centery = 350
-        self.play_again_button.rect.centerx = SCREEN_WIDTH // 2
-        self.play_again_button.text_rect = self.play_again_button.text_surface.get_rect(center=self.play_again_button.rect.center)
+        profiler = self.profiler
+        if self.show_hud:
+            # The HUD changes every frame
+            self.dirty_rects.append(HUD_RECT)
         
-        self.menu_button.rect.centery = 450
-        self.menu_button.rect.centerx = SCREEN_WIDTH // 2
-        self.menu_button.text_rect = self.menu_button.text_surface.get_rect(center=self.menu_button.rect.center)
+        buttons = self.visible_buttons()
+        if self.full_redraw or not self.dirty_rect_mode:
+            self.draw_screen()
+            if self.show_hud:
+                self.draw_hud()
+            if profiler is not None:
+                profiler.mark("draw")
+            pygame.display.flip()
+            if profiler is not None:
+                profiler.mark("flip")
+            self.full_redraw = False
+            self.dirty_rects = []
+            for button in buttons:
+                button.dirty = False
+            return
         
-        self.play_again_button.draw(screen)
-        self.menu_button.draw(screen)
+        for button in buttons:
+            if button.dirty:
+                self.dirty_rects.append(button.rect)
+                button.dirty = False
+        
+        # Nothing changed since the last frame, so there is nothing to draw
+        if not self.dirty_rects:
+            return
+        
+        if len(self.dirty_rects) > MAX_DIRTY_RECTS:
+            self.dirty_rects = []
+            self.full_redraw = True
+            self.present()
+            return
+        
+        # Redraw every layer, clipped to each dirty region
+        rects = [view.rect(rect).clip(screen.get_rect()) for rect in self.dirty_rects]
+        for rect in rects:
+            screen.set_clip(rect)
+            self.draw_screen()
+        screen.set_clip(None)
+        if self.show_hud:
+            self.draw_hud()
+        if profiler is not None:
+            profiler.mark("draw")
+        pygame.display.update(rects)
+        if profiler is not None:
+            profiler.mark("flip")
+        self.dirty_rects = []
+    
+    def toggle_hud(self):
+        """Show or hide the profiler HUD, starting the profiler on first use"""
+        if self.profiler is None:
+            self.profiler = FrameProfiler()
+        self.show_hud = not self.show_hud
+        self.request_full_redraw()
+    
+    def export_profile(self):
+        """Write the recorded frames as CSV and Chrome trace JSON"""
+        if self.profiler is None:
+            return
+        self.profiler.export_csv(PROFILE_CSV)
+        self.profiler.export_chrome_trace(PROFILE_TRACE)
+        print(f"Profile exported to {PROFILE_CSV} and {PROFILE_TRACE}")
+    
+    def draw_hud(self):
+        """Draw FPS, frame-time percentiles and the per-phase breakdown"""
+        if not self.hud_lines or self.profiler.count % HUD_REFRESH_FRAMES == 0:
+            stats = self.profiler.summary()
+            phases = "  ".join(f"{name} {ms:.2f}" for name, ms in stats["phases_ms"].items())
+            self.hud_lines = [
+                f"FPS {stats['fps']:.1f}   p50 {stats['p50_ms']:.2f} ms   p99 {stats['p99_ms']:.2f} ms",
+                phases,
+            ]
+        screen.fill(BLACK, view.rect(HUD_RECT))
+        for i, line in enumerate(self.hud_lines):
+            # Rendered directly: the text changes constantly and would churn the shared cache
+            screen.blit(hud_font.render(line, True, WHITE), view.point((6, 4 + i * 19)))
+    
+    def is_idle(self):
+        """Return True when no frame needs drawing until the next input event"""
+        if self.show_hud or self.full_redraw or self.dirty_rects:
+            return False
+        return not any(button.dirty for button in self.visible_buttons())
+    
+    def next_events(self, idle):
+        """Return pending events, blocking for the first one while idle"""
+        if not idle:
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(self.idle_wait_ms)
+            if event.type == pygame.NOEVENT:
+                return []
+            events = [event] + pygame.event.get()
+        # Click-to-sound latency is measured from here; an idle wait wakes as the click arrives
+        self.dequeued_at = time.perf_counter()
+        return to_logical(events)
+    
+    def pacing_report(self):
+        """Return the seconds spent frame-paced and blocked idle, and the idle share"""
+        total = self.mode_time["active"] + self.mode_time["idle"]
+        report = dict(self.mode_time)
+        report["idle_fraction"] = self.mode_time["idle"] / total if total else 0.0
+        return report
     
     def reset_game(self):
-        self.guessed_letters = set()
-        self.wrong_guesses = 0
-        self.create_letter_buttons()
+        self.engine.reset()
+        for button in self.letter_buttons:
+            button.enabled = True
+            button.set_color(button.color)
+    
+    def set_state(self, game_state, category=None, word=None, guesses="", page=0):
+        """Put the game into a given state directly, without input"""
+        self.reset_game()
+        # Totals start from zero so a state always draws the same score
+        self.engine.score = self.engine.games_played = 0
+        self.clear_hint()
+        self.current_page = page
+        self.layout_category_buttons()
+        if word is not None:
+            self.engine.start_word(category, word)
+            for letter in guesses:
+                self.engine.check_guess(letter)
+            for button in self.letter_buttons:
+                button.enabled = not self.engine.is_guessed(button.text)
+        self.game_state = game_state
+        self.request_full_redraw()
+    
+    def render_state(self, game_state, **state):
+        """Draw a given state offscreen and return a copy of the frame"""
+        self.set_state(game_state, **state)
+        self.draw_screen()
+        return screen.copy()
+    
+    def layout_key(self):
+        """Return the key identifying the current button layout"""
+        if self.game_state == "category_select":
+            return (self.game_state, self.current_page)
+        return (self.game_state,)
+    
+    def hit_test(self, pos):
+        """Return the enabled button under pos on the current screen, or None"""
+        key = self.layout_key()
+        grid = self.hit_grids.get(key)
+        if grid is None:
+            grid = HitGrid(self.visible_buttons())
+            self.hit_grids[key] = grid
+        return grid.button_at(pos)
+    
+    def update_hover(self):
+        """Apply the latest pointer position to hover colors, once per frame"""
+        layout = self.layout_key()
+        if self.hover_pos is None and layout == self.hover_layout:
+            return
+        if self.hover_pos is not None:
+            self.pointer_pos = self.hover_pos
+            self.hover_pos = None
+        if layout != self.hover_layout:
+            # Buttons from the previous screen keep no stale hover color
+            if self.hovered is not None:
+                self.hovered.set_hover(False)
+            self.hovered = None
+            self.hover_layout = layout
+        
+        button = self.hit_test(self.pointer_pos) if self.pointer_pos is not None else None
+        if button is not self.hovered:
+            if self.hovered is not None:
+                self.hovered.set_hover(False)
+            if button is not None:
+                button.set_hover(True)
+            self.hovered = button
+    
+    def apply_word_changes(self):
+        """Swap in the word lists the watcher reloaded, between frames"""
+        if self.watcher is None:
+            return
+        for changes in self.watcher.pending():
+            start = time.perf_counter()
+            names_before = list(self.corpus.names)
+            for name, words in changes.updates.items():
+                self.corpus.add(name, words)
+            for name in changes.removed:
+                self.corpus.remove(name)
+            
+            # Only the changed categories lose their word schedules and hint tables
+            changed = list(changes.updates) + changes.removed
+            for name in changed:
+                if self.engine.scheduler is not None:
+                    self.engine.scheduler.forget(name)
+                self.hints.forget(name)
+            if self.engine.category in changes.removed and self.game_state == "playing":
+                # The category being played is gone; the round ends unscored
+                print(f"Category {self.engine.category} was removed; ending the current round.")
+                self.reset_game()
+                self.game_state = "category_select"
+                self.request_full_redraw()
+            elif self.engine.category in changed:
+                # The word being played keeps going, but its index may now point elsewhere
+                self.engine.word_index = -1
+            
+            # Category buttons, pages and their hit grids only change with the names
+            if self.corpus.names != names_before:
+                last_page = max(self.corpus.page_count(self.categories_per_page) - 1, 0)
+                self.current_page = min(self.current_page, last_page)
+                self.layout_category_buttons()
+                self.hit_grids = {key: grid for key, grid in self.hit_grids.items() if key[0] != "category_select"}
+                if self.game_state == "category_select":
+                    self.request_full_redraw()
+            
+            apply_ms = (time.perf_counter() - start) * 1000
+            latency_ms = (time.time_ns() - changes.changed_ns) / 1e6
+            print(f"Reloaded {', '.join(changed)}: parsed in {changes.parse_ms:.1f} ms, "
+                  f"applied in {apply_ms:.2f} ms, {latency_ms:.0f} ms after the change")
+    
+    def change_page(self, step):
+        self.current_page += step
+        self.layout_category_buttons()
+        self.request_full_redraw()
+    
+    def on_click(self, button):
+        """Perform the action of a clicked button"""
+        if self.game_state == "menu":
+            if button is self.play_button:
+                self.notice = None
+                self.game_state = "category_select"
+        
+        elif self.game_state == "category_select":
+            if button is self.prev_button:
+                self.change_page(-1)
+            elif button is self.next_button:
+                self.change_page(1)
+            else:
+                self.select_word(button.text)
+                self.game_state = "playing"
+        
+        elif self.game_state == "playing":
+            if button is self.hint_button:
+                self.show_hint()
+                return
+            self.check_guess(button.text)
+            button.enabled = False
+            self.mark_dirty(button.rect, WORD_AREA, HANGMAN_AREA, GUESSES_AREA)
+            self.clear_hint()
+            
+            # Check if game is over
+            if self.engine.status == "playing":
+                # Move the hint tree along in the background so a hint is a lookup
+                self.hints.follow(self.engine)
+            elif self.engine.status == "won":
+                win_sound.play()
+                self.record_game()
+                self.game_state = "game_over"
+            elif self.engine.status == "lost":
+                lose_sound.play()
+                self.record_game()
+                self.game_state = "game_over"
+        
+        elif self.game_state == "game_over":
+            if button is self.play_again_button:
+                self.reset_game()
+                self.game_state = "category_select"
+            elif button is self.menu_button:
+                self.reset_game()
+                self.game_state = "menu"
+    
+    def engine_failed(self, error):
+        """Return to the menu after a remote request failed, e.g. when the server restarted"""
+        print(f"Game server request failed: {error!r}")
+        self.notice = f"Game server error: {error}"
+        for button in self.letter_buttons:
+            button.enabled = True
+            button.set_color(button.color)
+        self.game_state = "menu"
+        self.request_full_redraw()
+    
+    def handle_event(self, event):
+        """Apply one input event to the game state; returns False on quit"""
+        if event.type == pygame.MOUSEMOTION:
+            # Hover is applied once per frame from the latest position
+            self.hover_pos = event.pos
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            audio.mark_input(self.dequeued_at)
+            self.hover_pos = event.pos
+            if event.button == 1:
+                button = self.hit_test(event.pos)
+                if button is not None:
+                    try:
+                        self.on_click(button)
+                    except self.engine_errors as e:
+                        self.engine_failed(e)
+        elif event.type == pygame.QUIT:
+            return False
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.request_full_redraw()
+        elif event.type == WORDS_CHANGED:
+            self.apply_word_changes()
+        elif event.type == HINT_READY:
+            self.apply_hint()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F3:
+                self.toggle_hud()
+            elif event.key == pygame.K_F4:
+                self.export_profile()
+        return True
     
     def run(self):
         clock = pygame.time.Clock()
         running = True
+        self.hints.prepare()
         
         while running:
-            mouse_pos = pygame.mouse.get_pos()
+            profiler = self.profiler
+            if profiler is not None:
+                profiler.begin_frame()
+            idle = self.is_idle()
+            frame_start = time.perf_counter()
+            events = self.next_events(idle)
+            if self.recorder is not None:
+                self.recorder.record(events)
+            if profiler is not None:
+                profiler.mark("wait")
             
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in events:
+                if not self.handle_event(event):
                     running = False
-                
-                if self.game_state == "menu":
-                    self.play_button.check_hover(mouse_pos)
-                    if self.play_button.is_clicked(mouse_pos, event):
-                        self.game_state = "category_select"
-                
-                elif self.game_state == "category_select":
-                    for i, button in enumerate(self.category_buttons):
-                        button.check_hover(mouse_pos)
-                        if button.is_clicked(mouse_pos, event):
-                            start_idx = self.current_page * self.categories_per_page
-                            category = list(word_categories.keys())[start_idx + i]
-                            self.select_word(category)
-                            self.game_state = "playing"
-                            self.games_played += 1
-                    
-                    # Check navigation buttons
-                    if self.current_page > 0:
-                        self.prev_button.check_hover(mouse_pos)
-                        if self.prev_button.is_clicked(mouse_pos, event):
-                            self.current_page -= 1
-                            self.create_category_buttons()
-                    
-                    if (self.current_page + 1) * self.categories_per_page < len(word_categories):
-                        self.next_button.check_hover(mouse_pos)
-                        if self.next_button.is_clicked(mouse_pos, event):
-                            self.current_page += 1
-                            self.create_category_buttons()
-                
-                elif self.game_state == "playing":
-                    for button in self.letter_buttons:
-                        if button.text not in self.guessed_letters:
-                            button.check_hover(mouse_pos)
-                            if button.is_clicked(mouse_pos, event):
-                                self.check_guess(button.text)
-                                
-                                # Check if game is over
-                                if self.is_word_guessed():
-                                    self.score += 1
-                                    win_sound.play()
-                                    self.game_state = "game_over"
-                                elif self.wrong_guesses >= self.max_wrong_guesses:
-                                    lose_sound.play()
-                                    self.game_state = "game_over"
-                
-                elif self.game_state == "game_over":
-                    self.play_again_button.check_hover(mouse_pos)
-                    self.menu_button.check_hover(mouse_pos)
-                    
-                    if self.play_again_button.is_clicked(mouse_pos, event):
-                        self.reset_game()
-                        self.game_state = "category_select"
-                    
-                    if self.menu_button.is_clicked(mouse_pos, event):
-                        self.reset_game()
-                        self.game_state = "menu"
+            self.update_hover()
+            if profiler is not None:
+                profiler.mark("events")
             
             # Draw the appropriate screen based on game state
-            if self.game_state == "menu":
-                self.draw_menu()
-            elif self.game_state == "category_select":
-                self.draw_category_select()
-            elif self.game_state == "playing":
-                self.draw_game()
-            elif self.game_state == "game_over":
-                self.draw_game_over()
-            
-            pygame.display.flip()
-            clock.tick(60)
+            self.present()
+            if self.first_frame_ms is None:
+                self.first_frame_ms = (time.perf_counter() - STARTED_AT) * 1000
+                print(f"First interactive frame after {self.first_frame_ms:.0f} ms")
+            if idle:
+                # Waking from the event wait must not add a frame of latency
+                clock.tick()
+                self.mode_time["idle"] += time.perf_counter() - frame_start
+            else:
+                clock.tick(self.max_fps)
+                self.mode_time["active"] += time.perf_counter() - frame_start
+            if profiler is not None:
+                profiler.mark("tick")
+                profiler.end_frame()
         
+        if self.profiler is not None and self.export_profile_on_exit:
+            self.export_profile()
+        if self.history is not None:
+            self.history.close()
+        if self.recorder is not None:
+            self.recorder.close(self)
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.hints.close()
+        report = self.pacing_report()
+        print(f"Frame pacing: {report['active']:.1f}s active, {report['idle']:.1f}s idle "
+              f"({report['idle_fraction']:.0%} idle)")
+        sound_report = audio.latency_report()
+        if sound_report["sounds"]:
+            print(f"Click (from dequeue) to sound: {sound_report['dispatch_p50_ms']:.2f} ms p50, "
+                  f"{sound_report['dispatch_p99_ms']:.2f} ms p99, plus {sound_report['buffer_ms']:.1f} ms mixer buffer")
         pygame.quit()
         sys.exit()
 
-if __name__ == "__main__":
-    # Create sounds directory if it doesn't exist
-    os.makedirs(os.path.join(os.path.dirname(__file__), "sounds"), exist_ok=True)
+def measure_startup():
+    """Time each startup phase up to the first presented frame, in milliseconds"""
+    timings = {}
+    start = time.perf_counter()
+    init_app()
+    timings["init_app"] = (time.perf_counter() - start) * 1000
     
+    phase_start = time.perf_counter()
+    preload_assets()
+    show_splash()
+    timings["load_assets"] = (time.perf_counter() - phase_start) * 1000
+    
+    phase_start = time.perf_counter()
     game = Hangman()
+    timings["create_game"] = (time.perf_counter() - phase_start) * 1000
+    
+    phase_start = time.perf_counter()
+    game.present()
+    pygame.event.pump()
+    timings["first_frame"] = (time.perf_counter() - phase_start) * 1000
+    
+    timings["total"] = (time.perf_counter() - start) * 1000
+    timings["since_import"] = (time.perf_counter() - STARTED_AT) * 1000
+    timings["image_cache_hit_rate"] = asset_loader.report()["cache_hit_rate"]
+    return timings
+
+def server_address(text):
+    """argparse type for HOST:PORT (HOST defaults to 127.0.0.1)"""
+    host, _, port = text.rpartition(":")
+    if not port.isdigit():
+        raise argparse.ArgumentTypeError(f"expected HOST:PORT, got {text!r}")
+    return host or "127.0.0.1", int(port)
+
+def positive_number(text):
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+    return value
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AWS Cloud Services Hangman Game")
+    parser.add_argument("--startup-benchmark", action="store_true", help="Time each startup phase and exit")
+    parser.add_argument("--server", type=server_address, metavar="HOST:PORT",
+                        help="Play against a game server (see server.py)")
+    parser.add_argument("--audio-buffer", type=int, default=audio.buffer,
+                        help="Mixer buffer in samples; larger values may stop crackling on slow machines")
+    parser.add_argument("--display", choices=DISPLAY_MODES, default="window",
+                        help="window, scaled (a resizable window) or fullscreen")
+    parser.add_argument("--render-scale", type=positive_number,
+                        help="Canvas size as a multiple of 800x600 (default: fitted to the screen)")
+    parser.add_argument("--max-wrong-guesses", type=int, default=MAX_WRONG_GUESSES)
+    parser.add_argument("--antialias", action="store_true", help="Smoothed gallows lines")
+    parser.add_argument("--no-history", action="store_true", help="Play without recording scores and statistics")
+    parser.add_argument("--record", metavar="PATH", help="Record the session for replay.py")
+    parser.add_argument("--no-watch", action="store_true", help="Do not reload edited word lists while running")
+    parser.add_argument("--profile", action="store_true", help="Record frame times from the first frame and export on exit")
+    args = parser.parse_args(argv)
+    if args.max_wrong_guesses < 1:
+        parser.error("--max-wrong-guesses must be at least 1")
+    if args.record and args.server:
+        parser.error("recording is not supported when playing against a server")
+    return args
+
+def main():
+    args = parse_args()
+    if args.startup_benchmark:
+        for phase, value in measure_startup().items():
+            if phase.endswith("_rate"):
+                print(f"{phase:>20}: {value:7.0%}")
+            else:
+                print(f"{phase:>20}: {value:7.1f} ms")
+        pygame.quit()
+        return
+    
+    # Create sounds directory if it doesn't exist
+    os.makedirs(SOUNDS_DIR, exist_ok=True)
+    
+    # Remote play: python hangman.py --server HOST:PORT
+    corpus = engine = None
+    if args.server:
+        from remote import REQUEST_ERRORS, RemoteEngine, load_remote_corpus
+        try:
+            engine = RemoteEngine(*args.server)
+            corpus = load_remote_corpus(engine)
+        except REQUEST_ERRORS as e:
+            sys.exit(f"Could not reach the game server at {args.server[0]}:{args.server[1]}: {e}")
+    
+    # Smaller buffers cut latency but may crackle on slow machines: --audio-buffer 512
+    audio.buffer = args.audio_buffer
+    
+    # Resolution-independent display: python hangman.py --display fullscreen
+    # (or scaled, a resizable window); --render-scale 1 draws at 800x600 and lets SDL upscale
+    init_app(args.display, args.render_scale)
+    preload_assets()
+    show_splash()
+    
+    # Scores and per-word statistics persist in history/ unless --no-history is given
+    history = None if args.no_history else GameHistory()
+    
+    # Record the session for replay.py: python hangman.py --record session.hrp
+    recorder = None
+    if args.record:
+        from replay import ReplayRecorder
+        corpus = load_corpus()
+        recorder = ReplayRecorder(args.record, corpus, args.max_wrong_guesses)
+        engine = HangmanEngine(corpus, args.max_wrong_guesses, rng=recorder.rng, scheduler=WordScheduler(corpus))
+    
+    game = Hangman(corpus=corpus, engine=engine, profile=args.profile,
+                   max_wrong_guesses=args.max_wrong_guesses, antialias=args.antialias, history=history)
+    game.recorder = recorder
+    if args.server:
+        game.engine_errors = REQUEST_ERRORS
+    
+    # Pick up edits to custom_words.py and words/ while running, unless playing remotely or recording
+    if not args.server and recorder is None and not args.no_watch:
+        from watcher import CorpusWatcher
+        game.watcher = CorpusWatcher(notify=lambda: pygame.event.post(pygame.event.Event(WORDS_CHANGED)))
+        game.watcher.start()
     game.run()
+
+if __name__ == "__main__":
+    main()
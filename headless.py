@@ -0,0 +1,115 @@
+"""
+Headless Hangman Runner
+
+Plays scripted Hangman games on the display-independent engine across a
+process pool, for balancing and regression runs on machines with no display.
+
+Usage:
+    python headless.py --games 1000000 --strategy frequency
+"""
+
+import argparse
+import os
+import random
+import time
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor
+
+from corpus import load_corpus
+from engine import ALPHABET, MAX_WRONG_GUESSES, HangmanEngine
+
+# English letter frequency order followed by digits, used by the "frequency" strategy
+FREQUENCY_ORDER = "ETAOINSRHLDCUMFPGWYBVKXJQZ0123456789"
+
+GAMES_PER_CHUNK = 50000
+
+def guess_order(strategy, rng):
+    """Returns the sequence of letters a scripted player guesses"""
+    if strategy == "frequency":
+        return FREQUENCY_ORDER
+    elif strategy == "alphabetical":
+        return ALPHABET
+    elif strategy == "random":
+        letters = list(ALPHABET)
+        rng.shuffle(letters)
+        return letters
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+def play_game(engine, category, word, letters, mask=None):
+    """Play one scripted game to the end and return the engine status"""
+    engine.start_word(category, word, mask)
+    for letter in letters:
+        engine.check_guess(letter)
+        if engine.status != "playing":
+            break
+    return engine.status
+
+def play_chunk(args):
+    """Play a chunk of games in a worker process and return aggregate counts"""
+    games, strategy, seed, max_wrong_guesses = args
+    rng = random.Random(seed)
+    corpus = load_corpus()
+    engine = HangmanEngine(corpus, max_wrong_guesses, rng)
+    # Words are drawn uniformly from the whole corpus via cumulative category sizes
+    ends = list(accumulate(len(corpus[name]) for name in corpus.names))
+
+    results = {"games": 0, "won": 0, "lost": 0, "misses": Counter(), "lost_words": Counter()}
+    for _ in range(games):
+        position = rng.randrange(ends[-1])
+        category_index = bisect_right(ends, position)
+        category = corpus.names[category_index]
+        words = corpus[category]
+        index = position - (ends[category_index - 1] if category_index else 0)
+        word = words[index]
+        status = play_game(engine, category, word, guess_order(strategy, rng), words.mask_at(index))
+        results["games"] += 1
+        if status == "won":
+            results["won"] += 1
+        else:
+            results["lost"] += 1
+            results["lost_words"][word] += 1
+        results["misses"][engine.wrong_guesses] += 1
+    return results
+
+def run_batch(games, strategy="frequency", processes=None, seed=0, max_wrong_guesses=MAX_WRONG_GUESSES):
+    """Play games across a process pool and return the merged results"""
+    chunks = []
+    remaining = games
+    index = 0
+    while remaining > 0:
+        size = min(GAMES_PER_CHUNK, remaining)
+        chunks.append((size, strategy, seed + index, max_wrong_guesses))
+        remaining -= size
+        index += 1
+
+    totals = {"games": 0, "won": 0, "lost": 0, "misses": Counter(), "lost_words": Counter()}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for result in executor.map(play_chunk, chunks):
+            for key in ("games", "won", "lost"):
+                totals[key] += result[key]
+            totals["misses"].update(result["misses"])
+            totals["lost_words"].update(result["lost_words"])
+    totals["seconds"] = time.perf_counter() - start
+    return totals
+
+def main():
+    parser = argparse.ArgumentParser(description="Play scripted Hangman games without a display")
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--strategy", choices=["frequency", "alphabetical", "random"], default="frequency")
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-wrong-guesses", type=int, default=MAX_WRONG_GUESSES)
+    args = parser.parse_args()
+
+    totals = run_batch(args.games, args.strategy, args.processes, args.seed, args.max_wrong_guesses)
+    games_per_minute = totals["games"] / totals["seconds"] * 60 if totals["seconds"] else 0
+    print(f"Played {totals['games']} games in {totals['seconds']:.2f}s ({games_per_minute:,.0f} games/min)")
+    print(f"Win rate: {totals['won'] / max(totals['games'], 1):.1%}")
+    print("Misses per game:", dict(sorted(totals["misses"].items())))
+    print("Most lost words:", totals["lost_words"].most_common(10))
+
+if __name__ == "__main__":
+    main()
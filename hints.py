@@ -0,0 +1,258 @@
+"""
+Hint Engine for Hangman Game
+
+Suggests the letter that best narrows down the words still consistent with
+the revealed pattern and the misses so far. Each category gets a decision
+tree: a node holds its candidate words, and guessing a letter splits them by
+the positions where the letter appears. Each node's split is computed once,
+and the parts become its children, so following a game down the tree
+is a dictionary lookup per guess. The best letter of a node is the one whose
+split leaves the fewest candidates on average.
+
+Roots are split when a category's table is built, and deeper nodes as the
+game reaches them, so asking for a hint only reads a stored letter. The game
+uses BackgroundHints, which builds the tables once the game starts and
+follows each guess on a worker thread, so none of it happens on a click; a
+hint is answered through a future.
+
+Usage:
+    python hints.py                       # Difficulty of every word
+    python hints.py --category "AWS Compute"
+"""
+
+import argparse
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from engine import ALPHABET, LETTER_BITS, MAX_WRONG_GUESSES
+
+MAX_NODES = 20000  # Per category; deeper nodes are dropped past this and rebuilt on demand
+
+def letter_positions(word):
+    """Returns {letter: bitmask of its positions} for the guessable symbols of a word"""
+    positions = {}
+    for position, letter in enumerate(word):
+        if letter in LETTER_BITS:
+            positions[letter] = positions.get(letter, 0) | 1 << position
+    return positions
+
+def word_shape(word):
+    """The pattern shown before any guess: length and the always-visible symbols"""
+    return "".join("_" if letter in LETTER_BITS else letter for letter in word)
+
+class HintNode:
+    """Candidate words after a sequence of guesses"""
+    __slots__ = ("candidates", "guess_mask", "best", "parts", "children")
+
+    def __init__(self, candidates, guess_mask):
+        self.candidates = candidates
+        self.guess_mask = guess_mask
+        self.best = None  # Best letter to guess next, None if nothing is left to guess
+        self.parts = None  # {letter: {positions: candidate indexes}} once split
+        self.children = {}  # (letter, positions) -> HintNode
+
+class HintTable:
+    """Decision tree over one category's words"""
+    def __init__(self, words, max_nodes=MAX_NODES):
+        self.words = words
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        shapes = {}
+        for index in range(len(words)):
+            shapes.setdefault(word_shape(words[index]), array("I")).append(index)
+        self.roots = {shape: HintNode(indexes, 0) for shape, indexes in shapes.items()}
+        for root in self.roots.values():
+            self.split(root)
+
+    def split(self, node):
+        """Partition a node's candidates by every unguessed letter and choose the best one"""
+        parts = {}
+        for index in node.candidates:
+            for letter, positions in letter_positions(self.words[index]).items():
+                if not LETTER_BITS[letter] & node.guess_mask:
+                    parts.setdefault(letter, {}).setdefault(positions, array("I")).append(index)
+
+        # Expected candidates left = sum of squared part sizes / candidates;
+        # ties go to the letter most likely to be in the word
+        count = len(node.candidates)
+        best_key = None
+        for letter, groups in parts.items():
+            hits = sum(len(group) for group in groups.values())
+            expected = sum(len(group) ** 2 for group in groups.values()) + (count - hits) ** 2
+            key = (expected, -hits, letter)
+            if best_key is None or key < best_key:
+                best_key = key
+        node.best = best_key[2] if best_key is not None else None
+        node.parts = parts
+        self.nodes += 1
+
+    def child(self, node, letter, positions):
+        """Returns the node reached by guessing letter with the given outcome"""
+        key = (letter, positions)
+        child = node.children.get(key)
+        if child is None:
+            if positions:
+                candidates = node.parts.get(letter, {}).get(positions, array("I"))
+            else:
+                bit = LETTER_BITS[letter]
+                masks = self.words.masks
+                candidates = array("I", (index for index in node.candidates if not masks[index] & bit))
+            child = HintNode(candidates, node.guess_mask | LETTER_BITS[letter])
+            if self.nodes >= self.max_nodes:
+                self.prune()
+            self.split(child)
+            node.children[key] = child
+        return child
+
+    def prune(self):
+        """Drop everything below the roots"""
+        for root in self.roots.values():
+            root.children = {}
+        self.nodes = len(self.roots)
+
+class HintEngine:
+    """Hint tables for every category, following the current game down its tree"""
+    def __init__(self, categories):
+        self.categories = categories
+        self.tables = {}
+        self.node = None
+        self.node_game = None  # (category, word) the node belongs to
+
+    def table(self, category):
+        table = self.tables.get(category)
+        if table is None:
+            table = HintTable(self.categories[category])
+            self.tables[category] = table
+        return table
+
+    def forget(self, category):
+        """Drop a category's table, e.g. after its word list changed"""
+        self.tables.pop(category, None)
+        self.node = self.node_game = None
+
+    def follow(self, engine):
+        """Returns the node matching the engine's current game, or None"""
+        return self.follow_game(engine.category, engine.word, engine.guess_mask)
+
+    def follow_game(self, category, word, guess_mask):
+        if category not in self.categories:
+            return None  # Removed by a reload
+        game = (category, word)
+        node = self.node
+        if node is None or game != self.node_game or node.guess_mask & ~guess_mask:
+            node = self.table(category).roots.get(word_shape(word))
+            if node is None:
+                return None
+            self.node_game = game
+        # Walk down through the guesses made since the last call
+        new_guesses = guess_mask & ~node.guess_mask
+        if new_guesses:
+            table = self.table(category)
+            positions = letter_positions(word)
+            for letter in ALPHABET:
+                if LETTER_BITS[letter] & new_guesses:
+                    node = table.child(node, letter, positions.get(letter, 0))
+        self.node = node
+        return node
+
+    def hint(self, engine):
+        """Returns the best letter to guess next, or None"""
+        return self.hint_game(engine.category, engine.word, engine.guess_mask)
+
+    def hint_game(self, category, word, guess_mask):
+        node = self.follow_game(category, word, guess_mask)
+        return node.best if node is not None else None
+
+class BackgroundHints:
+    """A HintEngine driven from one worker thread, which alone touches its tables"""
+    def __init__(self, categories):
+        self.hints = HintEngine(categories)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hints")
+        self.unbuilt = []  # Categories left to build, set by prepare() and then used by the worker alone
+
+    def submit(self, function, *args):
+        future = self.executor.submit(function, *args)
+        future.add_done_callback(report_failure)
+        return future
+
+    def prepare(self):
+        """Build every category's table in the background, one table per task
+
+        Work queued while a table is being built, such as following a new
+        game, runs before the next table, so the category being played is
+        built first and a hint never waits behind the whole corpus.
+        """
+        self.unbuilt = list(self.hints.categories)
+        self.submit(self.build_next)
+
+    def build_next(self):
+        while self.unbuilt:
+            category = self.unbuilt.pop(0)
+            if category in self.hints.categories and category not in self.hints.tables:
+                self.hints.table(category)
+                break
+        if self.unbuilt:
+            try:
+                self.submit(self.build_next)
+            except RuntimeError:
+                pass  # Closed while building
+
+    def follow(self, engine):
+        """Queue moving down the tree to the engine's current game"""
+        self.submit(self.hints.follow_game, engine.category, engine.word, engine.guess_mask)
+
+    def forget(self, category):
+        self.submit(self.hints.forget, category)
+
+    def hint(self, engine):
+        """Returns a future for the best letter to guess next, answered once the queued work is done"""
+        return self.submit(self.hints.hint_game, engine.category, engine.word, engine.guess_mask)
+
+    def close(self):
+        # Queued work is dropped; at most the running task finishes
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+def report_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        print(f"Hint worker error: {future.exception()!r}")
+
+def solve(table, word, max_wrong_guesses):
+    """Play a word by always taking the hint; returns (misses, guesses)"""
+    node = table.roots[word_shape(word)]
+    positions = letter_positions(word)
+    remaining = set(positions)
+    misses = guesses = 0
+    while remaining and misses < max_wrong_guesses and node.best is not None:
+        letter = node.best
+        guesses += 1
+        if letter in positions:
+            remaining.discard(letter)
+        else:
+            misses += 1
+        node = table.child(node, letter, positions.get(letter, 0))
+    return misses, guesses
+
+def word_difficulty(words, max_wrong_guesses=MAX_WRONG_GUESSES):
+    """Returns [(word, misses, guesses)] for a hint-guided player, hardest first"""
+    table = HintTable(words)
+    results = [(word, *solve(table, word, max_wrong_guesses)) for word in words]
+    results.sort(key=lambda result: (-result[1], -result[2], result[0]))
+    return results
+
+def main():
+    from corpus import load_corpus
+
+    parser = argparse.ArgumentParser(description="Score how hard each word is for a hint-guided player")
+    parser.add_argument("--category", action="append", help="Category to score (default: all)")
+    parser.add_argument("--max-wrong-guesses", type=int, default=MAX_WRONG_GUESSES)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    for category in args.category or corpus.names:
+        print(f"{category}:")
+        for word, misses, guesses in word_difficulty(corpus[category], args.max_wrong_guesses):
+            result = "lost" if misses >= args.max_wrong_guesses else "solved"
+            print(f"  {word:>24}: {misses} misses in {guesses} guesses ({result})")
+
+if __name__ == "__main__":
+    main()
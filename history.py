@@ -0,0 +1,214 @@
+"""
+Game History for Hangman Game
+
+Keeps every finished game in an append-only log (one JSON line per game:
+word, category, letters guessed, misses, duration). Writes are batched on a
+background thread so the game loop never waits for the disk.
+
+Totals per category and per word live in a snapshot file next to the log.
+The snapshot records how much of the log it covers, so startup loads the
+snapshot and replays only the short tail written since. Compaction folds
+the log into the snapshot and truncates it.
+
+Usage:
+    python history.py
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+
+from engine import ALPHABET
+
+HISTORY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history")
+LOG_NAME = "games.log"
+SNAPSHOT_NAME = "totals.json"
+SNAPSHOT_VERSION = 1
+BATCH_SIZE = 64  # Most results written with one write and fsync
+COMPACT_EVERY = 500  # Log records between compactions
+
+# Fields of a totals entry
+GAMES, WINS, MISSES, SECONDS = range(4)
+
+def new_totals():
+    return [0, 0, 0, 0.0]
+
+def add_result(totals, result):
+    """Add one game result to a totals structure"""
+    won = 1 if result["won"] else 0
+    for entry in (
+        totals["total"],
+        totals["categories"].setdefault(result["category"], new_totals()),
+        totals["words"].setdefault(result["word"], new_totals()),
+    ):
+        entry[GAMES] += 1
+        entry[WINS] += won
+        entry[MISSES] += result["misses"]
+        entry[SECONDS] += result["seconds"]
+
+def empty_totals():
+    return {"total": new_totals(), "categories": {}, "words": {}}
+
+def copy_totals(totals):
+    return {
+        "total": list(totals["total"]),
+        "categories": {name: list(entry) for name, entry in totals["categories"].items()},
+        "words": {word: list(entry) for word, entry in totals["words"].items()},
+    }
+
+def game_result(engine, seconds):
+    """Returns the log record for a finished game"""
+    return {
+        "time": round(time.time(), 3),
+        "category": engine.category,
+        "word": engine.word,
+        "letters": "".join(letter for letter in ALPHABET if engine.is_guessed(letter)),
+        "misses": engine.wrong_guesses,
+        "won": engine.status == "won",
+        "seconds": round(seconds, 3),
+    }
+
+class GameHistory:
+    """Append-only game log with a background writer and indexed totals"""
+    def __init__(self, directory=HISTORY_DIR, batch_size=BATCH_SIZE, compact_every=COMPACT_EVERY):
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+        self.batch_size = batch_size
+        self.compact_every = compact_every
+
+        start = time.perf_counter()
+        saved, log_size, records = self.load()
+        self.load_ms = (time.perf_counter() - start) * 1000
+        self.replayed = records
+
+        # The game thread reads and updates `totals`; the writer thread owns
+        # `saved` (what is on disk) and the log file, so no locking is needed
+        self.totals = copy_totals(saved)
+        self.saved = saved
+        self.log = open(self.log_path, "ab")
+        self.log_size = log_size
+        self.unsaved_records = records
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, name="history-writer", daemon=True)
+        self.writer.start()
+
+    def load(self):
+        """Returns (totals, log size, records replayed from the log tail)"""
+        totals = empty_totals()
+        covered = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path) as f:
+                snapshot = json.load(f)
+            if snapshot.get("version") == SNAPSHOT_VERSION:
+                totals = {key: snapshot[key] for key in ("total", "categories", "words")}
+                covered = snapshot["log_size"]
+
+        records = 0
+        size = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "r+b") as f:
+                data = f.read()
+                # Drop a record cut short by a crash mid-write
+                size = data.rfind(b"\n") + 1
+                if size < len(data):
+                    f.truncate(size)
+            if covered > size:
+                # Crashed between truncating the log and saving the snapshot;
+                # record the empty log before anything new is appended
+                covered = size
+                self.write_snapshot(totals, covered)
+            for line in data[covered:size].splitlines():
+                add_result(totals, json.loads(line))
+                records += 1
+        return totals, size, records
+
+    def write_snapshot(self, totals, log_size):
+        """Atomically replace the snapshot file"""
+        snapshot = dict(totals, version=SNAPSHOT_VERSION, log_size=log_size)
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+    def record(self, result):
+        """Queue a game result; returns immediately"""
+        add_result(self.totals, result)
+        self.queue.put(result)
+
+    def category_totals(self, category):
+        """Returns [games, wins, misses, seconds] for a category"""
+        return self.totals["categories"].get(category, new_totals())
+
+    def word_totals(self, word):
+        """Returns [games, wins, misses, seconds] for a word"""
+        return self.totals["words"].get(word, new_totals())
+
+    def write_loop(self):
+        while True:
+            batch = [self.queue.get()]
+            # Take whatever else is already waiting, up to one batch
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            records = [result for result in batch if result is not None]
+            if records:
+                self.append(records)
+            if stop or self.unsaved_records >= self.compact_every:
+                self.compact()
+            if stop:
+                return
+
+    def append(self, records):
+        data = b"".join(json.dumps(result, separators=(",", ":")).encode() + b"\n" for result in records)
+        self.log.write(data)
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.log_size += len(data)
+        for result in records:
+            add_result(self.saved, result)
+        self.unsaved_records += len(records)
+
+    def compact(self):
+        """Fold the log into the snapshot and truncate it"""
+        if not self.unsaved_records:
+            return
+        # Covering the whole log first means a crash at any step loses nothing
+        self.write_snapshot(self.saved, self.log_size)
+        self.log.truncate(0)
+        self.log.seek(0)
+        self.log_size = 0
+        self.write_snapshot(self.saved, 0)
+        self.unsaved_records = 0
+
+    def close(self):
+        """Write everything queued, compact and stop the writer thread"""
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+        self.log.close()
+
+def main():
+    history = GameHistory()
+    games, wins, misses, seconds = history.totals["total"]
+    print(f"Loaded totals in {history.load_ms:.1f} ms ({history.replayed} log records replayed)")
+    print(f"{games} games, {wins} won, {misses} misses, {seconds / 60:.1f} minutes played")
+    for name, entry in sorted(history.totals["categories"].items()):
+        print(f"{name:>24}: {entry[GAMES]:6} games, {entry[WINS] / entry[GAMES]:.0%} won, "
+              f"{entry[MISSES] / entry[GAMES]:.1f} misses per game")
+    missed = sorted(history.totals["words"].items(), key=lambda item: item[1][MISSES] / item[1][GAMES], reverse=True)
+    if missed:
+        print("Most missed words:")
+        for word, entry in missed[:10]:
+            print(f"{word:>24}: {entry[MISSES] / entry[GAMES]:.1f} misses per game over {entry[GAMES]} games")
+    history.close()
+
+if __name__ == "__main__":
+    main()
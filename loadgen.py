@@ -0,0 +1,87 @@
+"""
+Load Generator for the Hangman Game Server
+
+Opens many concurrent client sessions against server.py, plays scripted games
+and reports the sustained guess throughput. Without --port it starts its own
+server process, so no outside services are needed.
+
+Usage:
+    python loadgen.py --clients 200 --games 20
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from headless import FREQUENCY_ORDER
+from server import DEFAULT_HOST
+
+async def request(reader, writer, op, **fields):
+    fields["op"] = op
+    writer.write(json.dumps(fields).encode() + b"\n")
+    response = json.loads(await reader.readline())
+    if not response["ok"]:
+        raise RuntimeError(response["error"])
+    return response
+
+async def run_client(host, port, games, client_index, totals):
+    """Play scripted games in one session, counting guesses"""
+    reader, writer = await asyncio.open_connection(host, port)
+    categories = (await request(reader, writer, "categories"))["categories"]
+    for game in range(games):
+        category = categories[(client_index + game) % len(categories)]
+        await request(reader, writer, "new", category=category)
+        for letter in FREQUENCY_ORDER:
+            state = await request(reader, writer, "guess", letter=letter)
+            totals["guesses"] += 1
+            if state["status"] != "playing":
+                totals[state["status"]] += 1
+                break
+    writer.close()
+
+async def run_load(host, port, clients, games):
+    totals = {"guesses": 0, "won": 0, "lost": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(host, port, games, i, totals) for i in range(clients)))
+    totals["seconds"] = time.perf_counter() - start
+    return totals
+
+def start_server():
+    """Start server.py on a free port and return (process, port)"""
+    process = subprocess.Popen(
+        [sys.executable, "server.py", "--host", DEFAULT_HOST, "--port", "0", "--stats-interval", "0"],
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=sys.path[0] or ".",
+    )
+    line = process.stdout.readline()  # "Listening on host:port"
+    return process, int(line.rsplit(":", 1)[1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Hangman server guess throughput")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=None, help="Existing server port (default: start one)")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--games", type=int, default=20, help="Games per client")
+    args = parser.parse_args()
+
+    process = None
+    port = args.port
+    if port is None:
+        process, port = start_server()
+    try:
+        totals = asyncio.run(run_load(args.host, port, args.clients, args.games))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    rate = totals["guesses"] / totals["seconds"]
+    print(f"{args.clients} clients played {totals['won'] + totals['lost']} games "
+          f"({totals['guesses']} guesses) in {totals['seconds']:.2f}s: {rate:,.0f} guesses/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Frame Profiler for Hangman Game
+
+Records per-phase frame timings into a fixed-size ring buffer and exports
+them as CSV or as Chrome trace JSON (open in chrome://tracing or Perfetto).
+"""
+
+import csv
+import json
+import time
+from array import array
+
+# Phases of one main-loop iteration, in the order they run
+PHASES = ("wait", "events", "draw", "flip", "tick")
+DEFAULT_CAPACITY = 1024
+
+class FrameProfiler:
+    """Ring buffer of the last `capacity` frames' phase durations"""
+    def __init__(self, capacity=DEFAULT_CAPACITY, phases=PHASES):
+        self.capacity = capacity
+        self.phases = phases
+        self.phase_index = {name: i for i, name in enumerate(phases)}
+        self.starts = array("d", bytes(8 * capacity))
+        self.totals = array("d", bytes(8 * capacity))
+        self.durations = [array("d", bytes(8 * capacity)) for _ in phases]
+        self.count = 0  # Frames recorded since creation
+        self.slot = 0
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        self.frame_start = self.last_mark = now
+        self.slot = self.count % self.capacity
+        self.starts[self.slot] = now
+        for durations in self.durations:
+            durations[self.slot] = 0.0
+
+    def mark(self, phase):
+        """Charge the time since the previous mark to a phase"""
+        now = time.perf_counter()
+        self.durations[self.phase_index[phase]][self.slot] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        self.totals[self.slot] = time.perf_counter() - self.frame_start
+        self.count += 1
+
+    def slots(self):
+        """Returns the ring buffer slots of the recorded frames, oldest first"""
+        if self.count <= self.capacity:
+            return list(range(self.count))
+        start = self.count % self.capacity
+        return list(range(start, self.capacity)) + list(range(start))
+
+    def summary(self):
+        """Returns FPS, p50/p99 frame time and mean time per phase, in milliseconds"""
+        slots = self.slots()
+        if not slots:
+            return {"frames": 0, "fps": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "phases_ms": {}}
+        totals = sorted(self.totals[slot] for slot in slots)
+        elapsed = self.starts[slots[-1]] + self.totals[slots[-1]] - self.starts[slots[0]]
+        return {
+            "frames": len(slots),
+            "fps": len(slots) / elapsed if elapsed > 0 else 0.0,
+            "p50_ms": totals[len(totals) // 2] * 1000,
+            "p99_ms": totals[min(int(len(totals) * 0.99), len(totals) - 1)] * 1000,
+            "phases_ms": {
+                name: sum(self.durations[i][slot] for slot in slots) / len(slots) * 1000
+                for i, name in enumerate(self.phases)
+            },
+        }
+
+    def export_csv(self, path):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "start_ms", "total_ms"] + [f"{name}_ms" for name in self.phases])
+            first = self.count - len(self.slots())
+            for frame, slot in enumerate(self.slots(), first):
+                writer.writerow(
+                    [frame, f"{self.starts[slot] * 1000:.3f}", f"{self.totals[slot] * 1000:.3f}"]
+                    + [f"{durations[slot] * 1000:.3f}" for durations in self.durations]
+                )
+
+    def export_chrome_trace(self, path):
+        """Write each frame and its phases as complete ("X") events"""
+        events = []
+        first = self.count - len(self.slots())
+        for frame, slot in enumerate(self.slots(), first):
+            start_us = self.starts[slot] * 1e6
+            events.append({"name": "frame", "ph": "X", "pid": 1, "tid": 1, "ts": start_us,
+                           "dur": self.totals[slot] * 1e6, "args": {"frame": frame}})
+            # Phases run back to back in PHASES order
+            offset = start_us
+            for name, durations in zip(self.phases, self.durations):
+                duration = durations[slot] * 1e6
+                if duration:
+                    events.append({"name": name, "ph": "X", "pid": 1, "tid": 1, "ts": offset, "dur": duration})
+                    offset += duration
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,121 @@
+"""
+Remote Hangman Client
+
+RemoteEngine speaks the server.py protocol and offers the same interface as
+engine.HangmanEngine, so the pygame front-end can play against a game server.
+"""
+
+import json
+import socket
+
+from corpus import MemoryWordList, WordCorpus
+from engine import LETTER_BITS
+
+class RemoteError(Exception):
+    """Raised when the server rejects a request"""
+
+# What a request can raise: rejections, lost connections and timeouts (both OSError)
+REQUEST_ERRORS = (RemoteError, OSError)
+
+class RemoteEngine:
+    """Game session held by a server.py process"""
+    def __init__(self, host, port, timeout=5.0):
+        self.address = (host, port)
+        self.timeout = timeout
+        self.sock = None
+        self.stream = None
+        self.category = ""
+        self.word = ""
+        self.pattern = ""
+        self.guess_mask = 0
+        self.hit_mask = 0
+        self.wrong_guesses = 0
+        self.max_wrong_guesses = 0
+        self.status = "idle"
+        self.score = 0
+        self.games_played = 0
+        self.update(self.request("state"))
+
+    def connect(self):
+        self.sock = socket.create_connection(self.address, timeout=self.timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stream = self.sock.makefile("rwb")
+
+    def request(self, op, **fields):
+        # After a lost connection the next request reconnects, to a new server session
+        if self.stream is None:
+            self.connect()
+        fields["op"] = op
+        try:
+            self.stream.write(json.dumps(fields).encode() + b"\n")
+            self.stream.flush()
+            line = self.stream.readline()
+            if not line:
+                raise ConnectionError("Server closed the connection")
+        except OSError:
+            # A timed-out reply may still arrive, so the connection is not reused
+            self.close()
+            raise
+        response = json.loads(line)
+        if not response["ok"]:
+            raise RemoteError(response["error"])
+        return response
+
+    def update(self, state):
+        self.category = state["category"]
+        self.pattern = state["pattern"]
+        self.guess_mask = state["guess_mask"]
+        self.hit_mask = state["hit_mask"]
+        self.wrong_guesses = state["wrong_guesses"]
+        self.max_wrong_guesses = state["max_wrong_guesses"]
+        self.status = state["status"]
+        self.score = state["score"]
+        self.games_played = state["games_played"]
+        # The server only reveals the word once the game is over
+        self.word = state.get("word", self.pattern)
+
+    def categories(self):
+        return self.request("categories")["categories"]
+
+    def select_word(self, category):
+        self.update(self.request("new", category=category))
+
+    def check_guess(self, letter):
+        state = self.request("guess", letter=letter)
+        self.update(state)
+        return state["hit"]
+
+    def is_word_guessed(self):
+        return self.status == "won"
+
+    def is_over(self):
+        return self.status in ("won", "lost")
+
+    def is_guessed(self, letter):
+        return LETTER_BITS[letter] & self.guess_mask != 0
+
+    def is_in_word(self, letter):
+        # Only known for guessed letters, which is all the front-end asks about
+        return LETTER_BITS[letter] & self.hit_mask != 0
+
+    def masked_word(self):
+        return self.pattern
+
+    def reset(self):
+        self.update(self.request("reset"))
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.sock.close()
+            self.stream = self.sock = None
+
+def load_remote_corpus(engine):
+    """Returns a corpus of the server's category names for the category pages
+
+    The word lists are empty because the words stay on the server.
+    """
+    corpus = WordCorpus()
+    for name in engine.categories():
+        corpus.add(name, MemoryWordList([]))
+    return corpus
@@ -0,0 +1,224 @@
+"""
+Replay Recording and Playback for Hangman Game
+
+A replay holds the seed of the game's random number generator and a compact
+binary stream of the input events the game reacted to, stamped with the time
+of the frame that handled them. Playback feeds the events back through the
+same handle_event / update_hover / present path as Hangman.run, either in
+real time in a window or as fast as possible without a display, and checks
+that the game ends in the recorded state.
+
+Record:
+    python hangman.py --record session.hrp
+Play back:
+    python replay.py session.hrp
+    python replay.py replays/*.hrp --fast --headless
+"""
+
+import argparse
+import json
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+
+import pygame
+
+from engine import HangmanEngine
+from scheduler import WordScheduler
+
+MAGIC = b"HRPL"
+VERSION = 1
+HEADER = struct.Struct("<4sHQHI")  # magic, version, seed, max wrong guesses, corpus fingerprint
+EVENT = struct.Struct("<IBhhI")  # frame time in ms, kind, x, y, button or key
+TRAILER_LENGTH = struct.Struct("<I")
+
+# Event kinds; END is followed by the JSON final state
+END, MOTION, CLICK, KEY, QUIT = range(5)
+FRAME_START = 0x80  # Flag on the first event of each frame
+
+class ReplayError(Exception):
+    """Raised for unreadable replay files"""
+
+def corpus_fingerprint(corpus):
+    """Checksum of the category names and sizes a replay was recorded with"""
+    return zlib.crc32("\n".join(f"{name}:{len(corpus[name])}" for name in corpus.names).encode())
+
+def final_state(game):
+    """Returns the state a replay must end in"""
+    engine = game.engine
+    return {
+        "screen": game.game_state,
+        "score": engine.score,
+        "games_played": engine.games_played,
+        "category": engine.category,
+        "word": engine.word,
+        "guess_mask": engine.guess_mask,
+        "wrong_guesses": engine.wrong_guesses,
+    }
+
+def encode_events(events):
+    """Returns (kind, x, y, code) tuples for the events the game reacts to
+
+    Hover only follows the last pointer position in a frame, so a motion
+    event followed by another motion or a click in the same frame is dropped.
+    """
+    encoded = []
+    for event in events:
+        if event.type == pygame.MOUSEMOTION:
+            if encoded and encoded[-1][0] == MOTION:
+                encoded.pop()
+            encoded.append((MOTION, event.pos[0], event.pos[1], 0))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if encoded and encoded[-1][0] == MOTION:
+                encoded.pop()
+            encoded.append((CLICK, event.pos[0], event.pos[1], event.button))
+        elif event.type == pygame.KEYDOWN:
+            encoded.append((KEY, 0, 0, event.key))
+        elif event.type == pygame.QUIT:
+            encoded.append((QUIT, 0, 0, 0))
+    return encoded
+
+def decode_event(kind, x, y, code):
+    if kind == MOTION:
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+    elif kind == CLICK:
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=code)
+    elif kind == KEY:
+        return pygame.event.Event(pygame.KEYDOWN, key=code, mod=0)
+    return pygame.event.Event(pygame.QUIT)
+
+class ReplayRecorder:
+    """Streams a game's seed and input events to a replay file"""
+    def __init__(self, path, corpus, max_wrong_guesses, seed=None):
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(63)
+        # The engine must draw its words from this generator
+        self.rng = random.Random(self.seed)
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.seed, max_wrong_guesses, corpus_fingerprint(corpus)))
+        self.start = time.perf_counter()
+        self.events = 0
+
+    def record(self, events):
+        """Record the events handled in one frame"""
+        encoded = encode_events(events)
+        if not encoded:
+            return
+        frame_ms = int((time.perf_counter() - self.start) * 1000)
+        kind, x, y, code = encoded[0]
+        encoded[0] = (kind | FRAME_START, x, y, code)
+        self.file.write(b"".join(EVENT.pack(frame_ms, *event) for event in encoded))
+        self.events += len(encoded)
+
+    def close(self, game):
+        trailer = json.dumps(final_state(game)).encode()
+        frame_ms = int((time.perf_counter() - self.start) * 1000)
+        self.file.write(EVENT.pack(frame_ms, END, 0, 0, 0) + TRAILER_LENGTH.pack(len(trailer)) + trailer)
+        self.file.close()
+
+class Replay:
+    """A replay file read into frames of events"""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ReplayError(f"{path}: too short to be a replay")
+        magic, version, self.seed, self.max_wrong_guesses, self.fingerprint = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ReplayError(f"{path}: not a version {VERSION} replay")
+
+        self.path = path
+        self.frames = []  # (frame time in ms, [events])
+        self.final = None  # None if the recording was cut short
+        self.duration_ms = 0
+        self.event_count = 0
+        offset = HEADER.size
+        while offset + EVENT.size <= len(data):
+            frame_ms, kind, x, y, code = EVENT.unpack_from(data, offset)
+            offset += EVENT.size
+            self.duration_ms = frame_ms
+            if kind == END:
+                (length,) = TRAILER_LENGTH.unpack_from(data, offset)
+                offset += TRAILER_LENGTH.size
+                self.final = json.loads(data[offset:offset + length])
+                break
+            if kind & FRAME_START or not self.frames:
+                self.frames.append((frame_ms, []))
+            self.frames[-1][1].append(decode_event(kind & ~FRAME_START, x, y, code))
+            self.event_count += 1
+
+def play(replay, hangman, corpus, realtime=True, render=True):
+    """Feed a replay through a new game; returns (final state, seconds taken)"""
+    if corpus_fingerprint(corpus) != replay.fingerprint:
+        print(f"Warning: {replay.path} was recorded with different word lists")
+    # Same picker as the recording: adaptive, but without the recorder's play history
+    engine = HangmanEngine(corpus, replay.max_wrong_guesses, rng=random.Random(replay.seed),
+                           scheduler=WordScheduler(corpus))
+    game = hangman.Hangman(corpus=corpus, engine=engine, max_wrong_guesses=replay.max_wrong_guesses)
+    if render:
+        game.present()
+
+    start = time.perf_counter()
+    for frame_ms, events in replay.frames:
+        if realtime:
+            delay = start + frame_ms / 1000 - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pygame.event.pump()  # Keep the window responsive
+        for event in events:
+            game.handle_event(event)
+        game.update_hover()
+        if render:
+            game.present()
+    game.hints.close()
+    return final_state(game), time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Play back recorded Hangman sessions")
+    parser.add_argument("paths", nargs="+", help="Replay files")
+    parser.add_argument("--fast", action="store_true", help="Play back as fast as possible instead of in real time")
+    parser.add_argument("--headless", action="store_true", help="Use SDL's dummy video and audio drivers")
+    parser.add_argument("--no-render", action="store_true", help="Skip drawing; game logic and input only")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    # The drivers only need to be set before init_app(); hangman is imported
+    # here because it imports this module for --record
+    import hangman
+    from corpus import load_corpus
+
+    hangman.init_app()
+    corpus = load_corpus()
+    mismatches = 0
+    frames = events = 0
+    seconds = 0.0
+    for path in args.paths:
+        replay = Replay(path)
+        state, elapsed = play(replay, hangman, corpus, realtime=not args.fast, render=not args.no_render)
+        frames += len(replay.frames)
+        events += replay.event_count
+        seconds += elapsed
+        if replay.final is None:
+            result = "no final state recorded"
+        elif state == replay.final:
+            result = "ok"
+        else:
+            result = "MISMATCH " + ", ".join(
+                f"{key}: {replay.final[key]!r} -> {state.get(key)!r}" for key in replay.final if state.get(key) != replay.final[key]
+            )
+            mismatches += 1
+        print(f"{path}: {len(replay.frames)} frames in {elapsed:.2f}s "
+              f"(recorded {replay.duration_ms / 1000:.1f}s) {result}")
+    pygame.quit()
+
+    if seconds > 0:
+        print(f"{len(args.paths)} replays, {frames} frames, {events} events: {frames / seconds:,.0f} frames/s")
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
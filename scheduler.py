@@ -0,0 +1,139 @@
+"""
+Adaptive Word Scheduler for Hangman Game
+
+Picks words with probability proportional to a weight that grows with the
+player's misses and with the time since the word was last shown, so missed
+words come back sooner and just-seen words rest for a few games.
+
+Each word sits in a Leitner box: a loss sends it back to box 0, a clean win
+moves it up one box, and each box halves the weight. Weights are integers
+kept in a Fenwick tree per category, so a pick and a weight change both take
+O(log n) steps and no pass over the whole category is ever needed after the
+tree is built.
+"""
+
+from array import array
+from collections import deque
+
+# Weight per Leitner box; words start in NEW_BOX
+BOX_WEIGHTS = (16, 8, 4, 2, 1)
+NEW_BOX = 1
+CLEAN_WIN_MISSES = 1  # A win with at most this many misses moves the word up a box
+RECENT_WINDOW = 8  # Words shown in the last this many games get a reduced weight
+
+class FenwickTree:
+    """Prefix sums over integer weights with O(log n) updates and sampling"""
+    def __init__(self, weights):
+        self.size = len(weights)
+        self.weights = array("q", weights)
+        tree = array("q", bytes(8 * (self.size + 1)))
+        for i, weight in enumerate(weights, 1):
+            tree[i] += weight
+            parent = i + (i & -i)
+            if parent <= self.size:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.total = sum(weights)
+        self.top = 1 << (self.size.bit_length() - 1) if self.size else 0
+
+    def update(self, index, weight):
+        delta = weight - self.weights[index]
+        if not delta:
+            return
+        self.weights[index] = weight
+        self.total += delta
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, target):
+        """Returns the index whose cumulative weight range contains target"""
+        pos = 0
+        step = self.top
+        while step:
+            next_pos = pos + step
+            if next_pos <= self.size and self.tree[next_pos] <= target:
+                pos = next_pos
+                target -= self.tree[next_pos]
+            step >>= 1
+        return pos
+
+    def sample(self, rng):
+        return self.find(rng.randrange(self.total))
+
+def initial_box(totals):
+    """Leitner box for a word from its [games, wins, misses, seconds] history"""
+    games, wins = totals[0], totals[1]
+    box = NEW_BOX + wins - 2 * (games - wins)
+    return min(max(box, 0), len(BOX_WEIGHTS) - 1)
+
+class CategorySchedule:
+    """Boxes, recent words and weight tree for one category"""
+    def __init__(self, words, history, recent_window):
+        self.recent_window = recent_window
+        if history is not None:
+            self.boxes = bytearray(initial_box(history.word_totals(word)) for word in words)
+        else:
+            self.boxes = bytearray([NEW_BOX]) * len(words)
+        self.recent = deque()  # Indices of recently shown words, newest first
+        self.tree = FenwickTree([self.weight(index) for index in range(len(words))])
+
+    def weight(self, index, age=None):
+        # Words outside the recent window get the full recency factor
+        recency = self.recent_window + 1 if age is None else age + 1
+        return BOX_WEIGHTS[self.boxes[index]] * recency
+
+    def reweigh_recent(self):
+        for age, index in enumerate(self.recent):
+            self.tree.update(index, self.weight(index, age))
+
+    def mark_seen(self, index):
+        if index in self.recent:
+            self.recent.remove(index)
+        self.recent.appendleft(index)
+        if len(self.recent) > self.recent_window:
+            rested = self.recent.pop()
+            self.tree.update(rested, self.weight(rested))
+        self.reweigh_recent()
+
+    def record(self, index, won, misses):
+        box = self.boxes[index]
+        if not won:
+            box = 0
+        elif misses <= CLEAN_WIN_MISSES:
+            box = min(box + 1, len(BOX_WEIGHTS) - 1)
+        self.boxes[index] = box
+        age = self.recent.index(index) if index in self.recent else None
+        self.tree.update(index, self.weight(index, age))
+
+class WordScheduler:
+    """Weighted word picker shared by every category of a corpus"""
+    def __init__(self, categories, history=None, recent_window=RECENT_WINDOW):
+        self.categories = categories
+        self.history = history  # history.GameHistory for the starting boxes, or None
+        self.recent_window = recent_window
+        self.schedules = {}
+
+    def schedule(self, category):
+        schedule = self.schedules.get(category)
+        if schedule is None:
+            # Built on first use so unplayed categories cost nothing
+            schedule = CategorySchedule(self.categories[category], self.history, self.recent_window)
+            self.schedules[category] = schedule
+        return schedule
+
+    def choose(self, category, rng):
+        """Returns the index of the next word to show from a category"""
+        schedule = self.schedule(category)
+        index = schedule.tree.sample(rng)
+        schedule.mark_seen(index)
+        return index
+
+    def record(self, category, index, won, misses):
+        """Update a word's weight after its game ends"""
+        self.schedule(category).record(index, won, misses)
+
+    def forget(self, category):
+        """Drop a category's schedule, e.g. after its word list changed"""
+        self.schedules.pop(category, None)
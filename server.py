@@ -0,0 +1,147 @@
+"""
+Hangman Game Server
+
+Hosts many concurrent Hangman sessions over a local TCP connection. Each
+connection owns one game session; requests and responses are JSON objects,
+one per line:
+
+    {"op": "categories"}
+    {"op": "new", "category": "AWS Compute"}
+    {"op": "guess", "letter": "E"}
+    {"op": "state"}
+    {"op": "reset"}
+
+Usage:
+    python server.py --host 0.0.0.0 --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from corpus import load_corpus
+from engine import HangmanEngine
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Wait for the client to read once this much output is buffered
+WRITE_HIGH_WATER = 64 * 1024
+
+def session_state(engine):
+    """Returns the client-visible state of a session; the word is only revealed when the game is over"""
+    state = {
+        "ok": True,
+        "category": engine.category,
+        "pattern": engine.masked_word(),
+        "guess_mask": engine.guess_mask,
+        "hit_mask": engine.guess_mask & engine.word_mask,
+        "wrong_guesses": engine.wrong_guesses,
+        "max_wrong_guesses": engine.max_wrong_guesses,
+        "status": engine.status,
+        "score": engine.score,
+        "games_played": engine.games_played,
+    }
+    if engine.is_over():
+        state["word"] = engine.word
+    return state
+
+class GameServer:
+    """Serves one HangmanEngine session per TCP connection"""
+    def __init__(self, corpus=None, seed=None):
+        self.corpus = corpus if corpus is not None else load_corpus()
+        self.rng = random.Random(seed)
+        self.sessions = 0
+        self.requests = 0
+        self.guesses = 0
+        self.server = None
+
+    def handle_request(self, engine, line):
+        """Apply one request to a session and return the encoded response line"""
+        self.requests += 1
+        try:
+            request = json.loads(line)
+            op = request["op"]
+            if op == "guess":
+                self.guesses += 1
+                if engine.status != "playing":
+                    raise ValueError("No game in progress")
+                hit = engine.check_guess(request["letter"])
+                response = session_state(engine)
+                response["hit"] = hit
+            elif op == "new":
+                engine.select_word(request["category"])
+                response = session_state(engine)
+            elif op == "state":
+                response = session_state(engine)
+            elif op == "reset":
+                engine.reset()
+                response = session_state(engine)
+            elif op == "categories":
+                response = {"ok": True, "categories": self.corpus.names}
+            else:
+                raise ValueError(f"Unknown op: {op}")
+        except (ValueError, KeyError, TypeError) as e:
+            response = {"ok": False, "error": str(e)}
+        return json.dumps(response).encode() + b"\n"
+
+    async def handle_client(self, reader, writer):
+        engine = HangmanEngine(self.corpus, rng=self.rng)
+        self.sessions += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(self.handle_request(engine, line))
+                if writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def report_stats(self, interval):
+        """Print request throughput every interval seconds while there is traffic"""
+        last_guesses = self.guesses
+        last_time = time.perf_counter()
+        while True:
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            if self.guesses != last_guesses:
+                rate = (self.guesses - last_guesses) / (now - last_time)
+                print(f"{self.sessions} sessions, {rate:,.0f} guesses/s", flush=True)
+            last_guesses = self.guesses
+            last_time = now
+
+async def serve(host, port, stats_interval, seed=None):
+    game_server = GameServer(seed=seed)
+    host, port = await game_server.start(host, port)
+    # loadgen.py reads this line to find the port when it starts the server itself
+    print(f"Listening on {host}:{port}", flush=True)
+    if stats_interval:
+        asyncio.ensure_future(game_server.report_stats(stats_interval))
+    async with game_server.server:
+        await game_server.server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Host concurrent Hangman sessions over TCP")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--stats-interval", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.stats_interval, args.seed))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Vectorized Strategy Simulator for Hangman Game
+
+Plays every word in the corpus against a guessing strategy at once with
+NumPy. Only which symbols a word contains decides a game with a fixed guess
+order, so the corpus becomes a boolean words x symbols matrix built straight
+from the word lists' letter masks. A word is solved by the last of its
+symbols in guess order, and the absent symbols guessed before that one are
+its misses, which takes a handful of whole-matrix operations. A word is won
+under a miss budget exactly when that number is below the budget, so one
+pass answers every budget.
+
+Requires NumPy (pip install numpy).
+
+Usage:
+    python simulate.py --strategy frequency category random --trials 100
+    python simulate.py --budgets 3 10 --output words.csv
+"""
+
+import argparse
+import csv
+import time
+
+import numpy as np
+
+from corpus import load_corpus
+from engine import ALPHABET, MAX_WRONG_GUESSES
+from headless import FREQUENCY_ORDER
+
+STRATEGIES = ("frequency", "alphabetical", "random", "category")
+CHUNK_ROWS = 65536  # Words played per array operation, to bound memory
+
+# Column order of the letter matrix is ALPHABET, matching the mask bits
+FREQUENCY_COLUMNS = np.array([ALPHABET.index(letter) for letter in FREQUENCY_ORDER])
+
+def letter_matrix(corpus):
+    """Returns (words x symbols presence matrix, category index of each word)"""
+    masks = []
+    categories = []
+    for index, name in enumerate(corpus.names):
+        words = corpus[name]
+        if len(words):
+            masks.append(np.frombuffer(words.masks, dtype=np.uint64))
+            categories.append(np.full(len(words), index, dtype=np.int32))
+    if not masks:
+        return np.zeros((0, len(ALPHABET)), dtype=bool), np.zeros(0, dtype=np.int32)
+    masks = np.concatenate(masks)
+    bits = np.arange(len(ALPHABET), dtype=np.uint64)
+    presence = ((masks[:, None] >> bits) & np.uint64(1)).astype(bool)
+    return presence, np.concatenate(categories)
+
+def rank_of(order):
+    """Turns a guess order (symbol columns) into each symbol's guess position"""
+    ranks = np.empty(len(ALPHABET), dtype=np.float64)
+    ranks[order] = np.arange(len(ALPHABET))
+    return ranks
+
+def category_bounds(categories, category_count):
+    """Words are stored category by category; returns the start of each category and the end"""
+    return np.searchsorted(categories, np.arange(category_count + 1))
+
+def category_ranks(presence, bounds):
+    """Guess positions per category: most common symbols in the category first"""
+    frequency_rank = rank_of(FREQUENCY_COLUMNS)  # Ties follow English frequency
+    ranks = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        counts = presence[start:stop].sum(axis=0)
+        ranks.append(rank_of(np.lexsort((frequency_rank, -counts))))
+    return np.array(ranks)
+
+def misses_to_solve(presence, ranks):
+    """Misses each word costs before all its symbols are guessed
+
+    ranks holds each symbol's guess position, shared by every word or one
+    row per word. A word is solved by its last present symbol, and every
+    absent symbol guessed before that one is a miss.
+    """
+    solved_at = np.where(presence, ranks, -1.0).max(axis=1)
+    return ((ranks < solved_at[:, None]) & ~presence).sum(axis=1, dtype=np.int8)
+
+def simulate(presence, categories, category_count, strategy, trials=1, seed=0):
+    """Returns a trials x words matrix of misses to solve each word"""
+    rng = np.random.default_rng(seed)
+    if strategy != "random":
+        trials = 1  # Deterministic strategies play each word once
+    if strategy == "category":
+        bounds = category_bounds(categories, category_count)
+        per_category = category_ranks(presence, bounds)
+    results = np.empty((trials, len(presence)), dtype=np.int8)
+    for trial in range(trials):
+        if strategy == "category":
+            for index in range(category_count):
+                start, stop = bounds[index], bounds[index + 1]
+                for chunk in range(start, stop, CHUNK_ROWS):
+                    end = min(chunk + CHUNK_ROWS, stop)
+                    results[trial, chunk:end] = misses_to_solve(presence[chunk:end], per_category[index])
+            continue
+        for start in range(0, len(presence), CHUNK_ROWS):
+            rows = presence[start:start + CHUNK_ROWS]
+            if strategy == "frequency":
+                ranks = rank_of(FREQUENCY_COLUMNS)
+            elif strategy == "alphabetical":
+                ranks = np.arange(len(ALPHABET), dtype=np.float64)
+            else:
+                # Sorting by independent uniform keys is a uniform random order
+                ranks = rng.random(rows.shape)
+            results[trial, start:start + CHUNK_ROWS] = misses_to_solve(rows, ranks)
+    return results
+
+def summarize(misses, bounds, budget):
+    """Returns per-word win rates and mean misses, and per-category results"""
+    won = misses < budget
+    capped = np.minimum(misses, budget)  # A lost game ends at the budget
+    word_win_rate = won.mean(axis=0)
+    word_misses = capped.mean(axis=0)
+    per_category = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if start == stop:
+            per_category.append(None)
+            continue
+        histogram = np.bincount(capped[:, start:stop].ravel(), minlength=budget + 1)
+        per_category.append({
+            "games": int(won[:, start:stop].size),
+            "win_rate": float(won[:, start:stop].mean()),
+            "misses": histogram.tolist(),
+        })
+    return word_win_rate, word_misses, per_category
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate guessing strategies on every word at once")
+    parser.add_argument("--strategy", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--max-wrong-guesses", type=int, default=MAX_WRONG_GUESSES)
+    parser.add_argument("--budgets", type=int, nargs=2, metavar=("LOW", "HIGH"),
+                        help="Also print the overall win rate for each miss budget in this range")
+    parser.add_argument("--trials", type=int, default=20, help="Games per word for the random strategy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write per-word results to this CSV file")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    presence, categories = letter_matrix(corpus)
+    category_count = len(corpus.names)
+    bounds = category_bounds(categories, category_count)
+    budget = args.max_wrong_guesses
+    print(f"{len(presence)} words in {category_count} categories, {budget} misses allowed")
+
+    rows = []
+    for strategy in args.strategy:
+        start = time.perf_counter()
+        misses = simulate(presence, categories, category_count, strategy, args.trials, args.seed)
+        seconds = time.perf_counter() - start
+        word_win_rate, word_misses, per_category = summarize(misses, bounds, budget)
+
+        print(f"\n{strategy}: {misses.size} games in {seconds:.3f}s, "
+              f"win rate {(misses < budget).mean():.1%}")
+        for name, result in zip(corpus.names, per_category):
+            if result is not None:
+                print(f"{name:>24}: {result['win_rate']:6.1%} won, misses {result['misses']}")
+        if args.budgets:
+            low, high = args.budgets
+            print("Win rate by budget:", {b: round(float((misses < b).mean()), 4) for b in range(low, high + 1)})
+
+        if args.output:
+            offset = 0
+            for name in corpus.names:
+                words = corpus[name]
+                for index in range(len(words)):
+                    rows.append([strategy, name, words[index],
+                                 f"{word_win_rate[offset + index]:.4f}", f"{word_misses[offset + index]:.3f}"])
+                offset += len(words)
+
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["strategy", "category", "word", "win_rate", "mean_misses"])
+            writer.writerows(rows)
+
+if __name__ == "__main__":
+    main()
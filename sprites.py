@@ -0,0 +1,86 @@
+"""
+Hangman Sprites
+
+Renders every stage of the gallows drawing once into a sprite sheet, so the
+game draws the current stage with a single blit. The body parts are spread
+over however many wrong guesses the game allows.
+"""
+
+import pygame
+
+# Screen area covered by the gallows drawing
+SPRITE_AREA = pygame.Rect(140, 90, 200, 270)
+
+# Anti-aliased stages are drawn this many times larger and smoothscaled down
+SUPERSAMPLE = 4
+
+# Gallows base, always shown
+BASE = ("line", (150, 350), (250, 350), 5)
+
+# Parts in the order they appear, in screen coordinates
+PARTS = [
+    ("line", (200, 350), (200, 100), 5),  # Pole
+    ("line", (200, 100), (300, 100), 5),  # Top beam
+    ("line", (300, 100), (300, 150), 5),  # Rope
+    ("circle", (300, 170), 20, 3),  # Head
+    ("line", (300, 190), (300, 250), 3),  # Body
+    ("line", (300, 210), (270, 230), 3),  # Left arm
+    ("line", (300, 210), (330, 230), 3),  # Right arm
+    ("line", (300, 250), (270, 300), 3),  # Left leg
+    ("line", (300, 250), (330, 300), 3),  # Right leg
+]
+
+# Parts added by each miss in the classic six-miss game (body and arms arrive together, then both legs)
+CLASSIC_STAGES = [1, 1, 1, 1, 3, 2]
+
+def stage_part_counts(max_wrong_guesses):
+    """Returns how many parts are shown after 0, 1, ... max_wrong_guesses misses"""
+    if max_wrong_guesses < 1:
+        raise ValueError(f"max_wrong_guesses must be at least 1, got {max_wrong_guesses}")
+    if max_wrong_guesses == len(CLASSIC_STAGES):
+        counts = [0]
+        for added in CLASSIC_STAGES:
+            counts.append(counts[-1] + added)
+        return counts
+    # Spread the parts evenly, with the full figure on the last miss
+    return [-(-miss * len(PARTS) // max_wrong_guesses) for miss in range(max_wrong_guesses + 1)]
+
+def draw_part(surface, part, color, scale):
+    """Draw one part onto a surface whose origin is SPRITE_AREA.topleft"""
+    def point(pos):
+        return ((pos[0] - SPRITE_AREA.x) * scale, (pos[1] - SPRITE_AREA.y) * scale)
+
+    if part[0] == "line":
+        pygame.draw.line(surface, color, point(part[1]), point(part[2]), round(part[3] * scale))
+    else:
+        pygame.draw.circle(surface, color, point(part[1]), part[2] * scale, round(part[3] * scale))
+
+def render_stage(part_count, color, antialias, render_scale=1):
+    """Returns a transparent surface with the base and the first part_count parts"""
+    size = (round(SPRITE_AREA.width * render_scale), round(SPRITE_AREA.height * render_scale))
+    scale = render_scale * SUPERSAMPLE if antialias else render_scale
+    surface = pygame.Surface((round(SPRITE_AREA.width * scale), round(SPRITE_AREA.height * scale)), pygame.SRCALPHA)
+    for part in [BASE] + PARTS[:part_count]:
+        draw_part(surface, part, color, scale)
+    if antialias:
+        surface = pygame.transform.smoothscale(surface, size)
+    return surface
+
+class HangmanSprites:
+    """Sprite sheet with one frame per gallows stage for a given miss budget and render scale"""
+    def __init__(self, max_wrong_guesses, color, antialias=False, render_scale=1):
+        counts = stage_part_counts(max_wrong_guesses)
+        self.stages = len(counts)
+        self.position = (round(SPRITE_AREA.x * render_scale), round(SPRITE_AREA.y * render_scale))
+        self.frame_size = (round(SPRITE_AREA.width * render_scale), round(SPRITE_AREA.height * render_scale))
+        sheet = pygame.Surface((self.frame_size[0] * self.stages, self.frame_size[1]), pygame.SRCALPHA)
+        for stage, count in enumerate(counts):
+            sheet.blit(render_stage(count, color, antialias, render_scale), (stage * self.frame_size[0], 0))
+        self.sheet = sheet.convert_alpha()
+
+    def frame_rect(self, stage):
+        return pygame.Rect((stage * self.frame_size[0], 0), self.frame_size)
+
+    def draw(self, surface, wrong_guesses):
+        stage = min(max(wrong_guesses, 0), self.stages - 1)
+        surface.blit(self.sheet, self.position, self.frame_rect(stage))
@@ -0,0 +1,151 @@
+"""
+Word List Watcher for Hangman Game
+
+Polls custom_words.py and the word list files with os.stat, re-parses only
+the categories whose words changed on a background thread, and hands the
+new word lists to the game, which swaps them in between frames.
+"""
+
+import os
+import queue
+import runpy
+import threading
+import time
+
+from corpus import WORDS_DIR, MemoryWordList, category_name, load_word_file
+
+CUSTOM_WORDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "custom_words.py")
+POLL_INTERVAL = 1.0  # Seconds between stat passes
+
+def file_signature(path):
+    """Returns (size, mtime_ns) of a file, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def parse_custom_words(path):
+    """Run custom_words.py afresh and return its categories"""
+    return dict(runpy.run_path(path)["get_custom_categories"]())
+
+class WordChanges:
+    """Categories replaced, added or removed by one poll"""
+    def __init__(self, updates, removed, parse_ms, changed_ns):
+        self.updates = updates  # name -> WordList, for new and changed categories
+        self.removed = removed  # Names of categories that disappeared
+        self.parse_ms = parse_ms
+        self.changed_ns = changed_ns  # Newest mtime among the changed files
+
+class CorpusWatcher:
+    """Background stat polling of the word sources behind a corpus"""
+    def __init__(self, words_dir=WORDS_DIR, custom_words_path=CUSTOM_WORDS_PATH,
+                 interval=POLL_INTERVAL, notify=None):
+        self.words_dir = words_dir
+        self.custom_words_path = custom_words_path
+        self.interval = interval
+        self.notify = notify  # Called from the watcher thread when changes are ready
+        self.changes = queue.Queue()
+        self.stopped = threading.Event()
+        self.thread = None
+
+        # What the corpus was loaded from; only the watcher thread touches these after start()
+        self.custom_signature = file_signature(custom_words_path)
+        self.custom = {name: list(words) for name, words in parse_custom_words(custom_words_path).items()}
+        self.file_signatures = self.scan_files()
+
+    def scan_files(self):
+        signatures = {}
+        if os.path.isdir(self.words_dir):
+            for filename in os.listdir(self.words_dir):
+                if filename.endswith(".txt"):
+                    path = os.path.join(self.words_dir, filename)
+                    signature = file_signature(path)
+                    if signature is not None:
+                        signatures[path] = signature
+        return signatures
+
+    def start(self):
+        self.thread = threading.Thread(target=self.poll_loop, name="word-watcher", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def poll_loop(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                changes = self.check()
+            except Exception as e:
+                # A failed poll must not end hot reload for the rest of the session
+                print(f"Word list watcher error: {e}")
+                continue
+            if changes is not None:
+                self.changes.put(changes)
+                if self.notify is not None:
+                    self.notify()
+
+    def check(self):
+        """Returns the WordChanges since the last check, or None"""
+        start = time.perf_counter()
+        updates = {}
+        removed = []
+        changed_ns = 0
+
+        signature = file_signature(self.custom_words_path)
+        if signature is not None and signature != self.custom_signature:
+            self.custom_signature = signature
+            try:
+                categories = parse_custom_words(self.custom_words_path)
+            except Exception as e:
+                # A half-saved file is picked up again on its next write
+                print(f"Could not reload {self.custom_words_path}: {e}")
+            else:
+                for name, words in categories.items():
+                    words = list(words)
+                    if self.custom.get(name) != words:
+                        word_list = MemoryWordList(words)
+                        if len(word_list):
+                            updates[name] = word_list
+                        else:
+                            removed.append(name)  # A category without words is left out
+                removed.extend(name for name in self.custom if name not in categories)
+                self.custom = {name: list(words) for name, words in categories.items()}
+                if updates or removed:
+                    changed_ns = signature[1]
+
+        files = self.scan_files()
+        for path, signature in files.items():
+            if self.file_signatures.get(path) != signature:
+                name = category_name(os.path.basename(path))
+                try:
+                    words = load_word_file(path)
+                except (OSError, ValueError) as e:
+                    # Deleted or renamed since the scan, or unreadable; retried on its next change
+                    print(f"Could not reload {path}: {e}")
+                    continue
+                if len(words):
+                    updates[name] = words
+                else:
+                    removed.append(name)
+                changed_ns = max(changed_ns, signature[1])
+        for path in self.file_signatures:
+            if path not in files:
+                removed.append(category_name(os.path.basename(path)))
+                changed_ns = time.time_ns()
+        self.file_signatures = files
+
+        if not updates and not removed:
+            return None
+        return WordChanges(updates, removed, (time.perf_counter() - start) * 1000, changed_ns)
+
+    def pending(self):
+        """Returns the changes waiting to be applied, oldest first"""
+        changes = []
+        while True:
+            try:
+                changes.append(self.changes.get_nowait())
+            except queue.Empty:
+                return changes